@@ -0,0 +1,86 @@
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks.fake_server import FakeWiremock
+from benchmarks.runner import (
+    DEFAULT_THRESHOLD,
+    calibrate,
+    compare,
+    format_table,
+    measure,
+    save_results,
+)
+from benchmarks.suite import build_suite
+from qawiremock import WiremockClient
+from qawiremock.report import Logger, ReportLevel
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure the client overhead against a local fake WireMock.",
+    )
+    parser.add_argument("-k", "--filter", help="Run benchmarks containing this text")
+    parser.add_argument("-n", "--iterations", type=int, help="Iterations per benchmark")
+    parser.add_argument("-o", "--output", type=Path, help="Write results to this file")
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE, help="Results to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown before a regression is reported",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with an error when a regression is reported",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Overwrite the baseline"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    Logger.configure(level=ReportLevel.OFF)
+    calibration_ms = calibrate()
+    with FakeWiremock() as fake, WiremockClient(fake.host, fake.port) as client:
+        benchmarks = [
+            benchmark
+            for benchmark in build_suite(fake, client)
+            if not args.filter or args.filter in benchmark.name
+        ]
+        results = []
+        for benchmark in benchmarks:
+            results.append(measure(benchmark, args.iterations))
+            print(format_table(results[-1:]).splitlines()[-1], flush=True)
+
+    print()
+    print(format_table(results))
+    print(f"calibration: {calibration_ms:.3f} ms")
+    if args.output:
+        save_results(results, args.output, calibration_ms)
+    if args.save_baseline:
+        save_results(results, args.baseline, calibration_ms)
+        return 0
+    if not args.baseline.exists():
+        return 0
+    regressions = compare(results, args.baseline, calibration_ms, args.threshold)
+    label = "REGRESSION" if args.fail_on_regression else "slower"
+    for regression in regressions:
+        print(
+            f"{label} {regression.name}: {regression.baseline_ms:.3f} ms -> "
+            f"{regression.current_ms:.3f} ms (x{regression.ratio:.2f} "
+            "relative to calibration)"
+        )
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,391 @@
+import json
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import uuid4
+
+SCENARIO_STARTED = "Started"
+
+
+def resolve_path(document: Any, expression: str) -> Any:
+    """
+    Resolve a dotted JSON path such as `$.qawiremock.stub`.
+
+    :param document: The JSON document.
+    :param expression: The path expression.
+    :return: The value, or None if the path does not exist.
+    """
+    for key in expression.removeprefix("$.").split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+def matches_metadata(metadata: dict[str, Any] | None, pattern: dict[str, Any]) -> bool:
+    """
+    Match metadata against a `matchesJsonPath` pattern with `equalTo` or `matches`.
+
+    :param metadata: The metadata of a mapping.
+    :param pattern: The metadata pattern.
+    :return: True if the metadata matches.
+    """
+    matcher = pattern.get("matchesJsonPath") or {}
+    value = resolve_path(metadata or {}, matcher.get("expression", "$"))
+    if value is None:
+        return False
+    if "equalTo" in matcher:
+        return bool(value == matcher["equalTo"])
+    if "matches" in matcher:
+        return re.fullmatch(matcher["matches"], str(value)) is not None
+    return True
+
+
+def matches_request(request: dict[str, Any], pattern: dict[str, Any]) -> bool:
+    """
+    Match a logged request against the url and method of a request pattern.
+
+    :param request: The logged request.
+    :param pattern: The request pattern.
+    :return: True if the request matches.
+    """
+    method = pattern.get("method", "ANY")
+    if method != "ANY" and request.get("method") != method:
+        return False
+    return "url" not in pattern or request.get("url") == pattern["url"]
+
+
+class FakeWiremock:
+    """
+    In-process stand-in for the WireMock admin API.
+
+    Mappings, scenarios, body files and the request journal are kept in memory.
+    Request patterns match on url and method only, and metadata patterns on
+    `matchesJsonPath` with `equalTo` or `matches`, which covers what the
+    client sends. The journal is filled with `seed_journal` since the server
+    does not serve stubbed traffic.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        :param host: The interface to listen on.
+        :param port: The port to listen on, 0 picks a free one.
+        """
+        self.lock = threading.Lock()
+        self.mappings: dict[str, dict[str, Any]] = {}
+        self.files: dict[str, bytes] = {}
+        self.scenario_states: dict[str, str] = {}
+        self.journal: list[dict[str, Any]] = []
+        self._by_stub: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return str(self._server.server_address[0])
+
+    @property
+    def port(self) -> int:
+        return int(self._server.server_address[1])
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Serve requests in a background thread.
+        """
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the listening socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        """
+        Drop all mappings, files, scenario states and journal entries.
+        """
+        with self.lock:
+            self.mappings.clear()
+            self.files.clear()
+            self.scenario_states.clear()
+            self._set_journal([])
+
+    def seed_journal(
+        self, count: int, mappings: list[dict[str, Any]] | None = None
+    ) -> None:
+        """
+        Append generated journal entries, served in turn by the given mappings.
+
+        :param count: The number of entries to add.
+        :param mappings: The mappings serving the requests, unmatched if omitted.
+        """
+        entries = [
+            self._serve_event(mappings[i % len(mappings)] if mappings else None)
+            for i in range(count)
+        ]
+        with self.lock:
+            self._set_journal(self.journal + entries)
+
+    @staticmethod
+    def _serve_event(mapping: dict[str, Any] | None) -> dict[str, Any]:
+        request = (mapping or {}).get("request") or {}
+        url = request.get("url") or request.get("urlPath") or "/unmatched"
+        now = datetime.now(timezone.utc)
+        logged = {
+            "url": url,
+            "absoluteUrl": f"http://localhost{url}",
+            "method": request.get("method", "GET"),
+            "clientIp": "127.0.0.1",
+            "headers": {"Host": "localhost"},
+            "cookies": {},
+            "browserProxyRequest": False,
+            "loggedDate": int(now.timestamp() * 1000),
+            "bodyAsBase64": "",
+            "loggedDateString": now.isoformat(timespec="milliseconds"),
+        }
+        status = 200 if mapping else 404
+        stub_mapping = {
+            "id": mapping["id"] if mapping else None,
+            "uuid": mapping["id"] if mapping else None,
+            "request": logged,
+            "response": {"status": status},
+            "metadata": (mapping or {}).get("metadata"),
+        }
+        return {
+            "id": str(uuid4()),
+            "request": logged,
+            "responseDefinition": {"status": status},
+            "response": {"status": status},
+            "wasMatched": mapping is not None,
+            "timing": {
+                "addedDelay": 0,
+                "processTime": 1,
+                "responseSendTime": 1,
+                "serveTime": 1,
+                "totalTime": 2,
+            },
+            "subEvents": [],
+            "stubMapping": stub_mapping,
+        }
+
+    def _set_journal(self, entries: list[dict[str, Any]]) -> None:
+        self.journal = entries
+        self._by_stub = defaultdict(list)
+        for entry in entries:
+            if entry["wasMatched"]:
+                self._by_stub[entry["stubMapping"]["id"]].append(entry)
+
+    def _add_mapping(self, mapping: dict[str, Any]) -> dict[str, Any]:
+        _id = mapping.get("id") or mapping.get("uuid") or str(uuid4())
+        mapping = {**mapping, "id": _id, "uuid": _id}
+        self.mappings[_id] = mapping
+        if mapping.get("scenarioName"):
+            self.scenario_states.setdefault(mapping["scenarioName"], SCENARIO_STARTED)
+        return mapping
+
+    def _scenarios(self) -> list[dict[str, Any]]:
+        possible: defaultdict[str, set[str]] = defaultdict(set)
+        for mapping in self.mappings.values():
+            name = mapping.get("scenarioName")
+            if name:
+                possible[name].add(mapping.get("requiredScenarioState") or "")
+                if mapping.get("newScenarioState"):
+                    possible[name].add(mapping["newScenarioState"])
+        return [
+            {
+                "id": name,
+                "name": name,
+                "state": self.scenario_states.get(name, SCENARIO_STARTED),
+                "possibleStates": sorted(states - {""}),
+            }
+            for name, states in possible.items()
+        ]
+
+    def _list_requests(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        if "matchingStub" in query:
+            entries = self._by_stub.get(query["matchingStub"][0], [])
+        elif query.get("unmatched") == ["true"]:
+            entries = [entry for entry in self.journal if not entry["wasMatched"]]
+        else:
+            entries = self.journal
+        since = query.get("since", [None])[0]
+        if since is not None:
+            after = int(datetime.fromisoformat(since).timestamp() * 1000)
+            entries = [
+                entry for entry in entries if entry["request"]["loggedDate"] > after
+            ]
+        result = entries[::-1]
+        if "limit" in query:
+            result = result[: int(query["limit"][0])]
+        return {
+            "requests": result,
+            "meta": {"total": len(entries)},
+            "requestJournalDisabled": False,
+        }
+
+    def handle(
+        self, method: str, path: str, query: dict[str, list[str]], body: Any
+    ) -> tuple[int, Any]:
+        """
+        Dispatch an admin API call.
+
+        :param method: The HTTP method.
+        :param path: The path below `/__admin`.
+        :param query: The parsed query string.
+        :param body: The parsed JSON body, raw bytes for files.
+        :return: The status code and the JSON response, or None for no body.
+        """
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        with self.lock:
+            if parts[0] == "mappings":
+                return self._handle_mappings(method, parts[1:], body)
+            if parts[0] == "requests":
+                return self._handle_requests(method, parts[1:], query, body)
+            if parts[0] == "scenarios":
+                return self._handle_scenarios(method, parts[1:], body)
+            if parts[0] == "files" and method == "PUT":
+                self.files["/".join(parts[1:])] = body
+                return 200, None
+        return 404, None
+
+    def _handle_mappings(
+        self, method: str, parts: list[str], body: Any
+    ) -> tuple[int, Any]:
+        route = (method, parts[0] if parts else "")
+        if route == ("GET", ""):
+            mappings = list(self.mappings.values())
+            return 200, {"mappings": mappings, "meta": {"total": len(mappings)}}
+        if route == ("POST", ""):
+            return 201, self._add_mapping(body)
+        if route == ("DELETE", ""):
+            self.mappings.clear()
+            self.scenario_states.clear()
+            return 200, None
+        if route == ("POST", "import"):
+            if (body.get("importOptions") or {}).get("deleteAllNotInImport"):
+                self.mappings.clear()
+            for mapping in body["mappings"]:
+                self._add_mapping(mapping)
+            return 200, None
+        if route in (("POST", "find-by-metadata"), ("POST", "remove-by-metadata")):
+            return self._handle_mappings_metadata(route[1], body)
+        return self._handle_mapping(method, parts[0])
+
+    def _handle_mappings_metadata(self, action: str, body: Any) -> tuple[int, Any]:
+        found = [
+            mapping
+            for mapping in self.mappings.values()
+            if matches_metadata(mapping.get("metadata"), body)
+        ]
+        if action == "find-by-metadata":
+            return 200, {"mappings": found, "meta": {"total": len(found)}}
+        for mapping in found:
+            del self.mappings[mapping["id"]]
+        return 200, None
+
+    def _handle_mapping(self, method: str, mapping_id: str) -> tuple[int, Any]:
+        if mapping_id not in self.mappings:
+            return 404, None
+        if method == "GET":
+            return 200, self.mappings[mapping_id]
+        if method == "DELETE":
+            del self.mappings[mapping_id]
+            return 200, None
+        return 404, None
+
+    def _handle_requests(
+        self, method: str, parts: list[str], query: dict[str, list[str]], body: Any
+    ) -> tuple[int, Any]:
+        route = (method, parts[0] if parts else "")
+        if route == ("GET", ""):
+            return 200, self._list_requests(query)
+        if route == ("DELETE", ""):
+            self._set_journal([])
+            return 200, None
+        if route == ("POST", "find"):
+            found = [
+                e["request"]
+                for e in self.journal
+                if matches_request(e["request"], body)
+            ]
+            return 200, {"requests": found}
+        if route == ("POST", "count"):
+            count = sum(matches_request(e["request"], body) for e in self.journal)
+            return 200, {"count": count}
+        if route == ("POST", "remove"):
+            kept = [e for e in self.journal if not matches_request(e["request"], body)]
+            self._set_journal(kept)
+            return 200, None
+        if route == ("POST", "remove-by-metadata"):
+            kept = [
+                e
+                for e in self.journal
+                if not matches_metadata(e["stubMapping"].get("metadata"), body)
+            ]
+            self._set_journal(kept)
+            return 200, None
+        if method == "DELETE":
+            self._set_journal([e for e in self.journal if e["id"] != parts[0]])
+            return 200, None
+        return 404, None
+
+    def _handle_scenarios(
+        self, method: str, parts: list[str], body: Any
+    ) -> tuple[int, Any]:
+        if method == "GET" and not parts:
+            return 200, {"scenarios": self._scenarios()}
+        if method == "POST" and parts == ["reset"]:
+            self.scenario_states.clear()
+            return 200, None
+        if method == "PUT" and len(parts) == 2 and parts[1] == "state":
+            self.scenario_states[parts[0]] = body.get("state", SCENARIO_STARTED)
+            return 200, None
+        return 404, None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _dispatch(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                path = url.path.removeprefix("/__admin")
+                body: Any = raw if path.startswith("/files") else None
+                if body is None and raw:
+                    body = json.loads(raw)
+                status, result = fake.handle(
+                    self.command, path, parse_qs(url.query), body
+                )
+                data = json.dumps(result).encode() if result is not None else b""
+                self.send_response(status)
+                if result is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,72 @@
+import argparse
+import json
+import subprocess
+import sys
+
+# Budgets in milliseconds, measured in a fresh interpreter.
+BUDGETS_MS = {
+    "qawiremock": 20.0,
+    "qawiremock.client": 400.0,
+}
+# Modules that must not be loaded by a bare `import qawiremock`.
+HEAVY_MODULES = ("requests", "pydantic", "allure", "wiremock")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps([elapsed, sorted(sys.modules)]))
+"""
+
+
+def measure_import(module: str, runs: int = 5) -> tuple[float, set[str]]:
+    """
+    Measure the import time of a module in fresh interpreters.
+
+    :param module: The module to import.
+    :param runs: Number of interpreters; the fastest run is kept.
+    :return: The import time in milliseconds and the loaded module names.
+    """
+    best = float("inf")
+    loaded: set[str] = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, modules = json.loads(output)
+        best = min(best, elapsed)
+        loaded = set(modules)
+    return best, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time",
+        description="Check the package import time against its budget.",
+    )
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+    for module, budget in BUDGETS_MS.items():
+        elapsed, loaded = measure_import(module, args.runs)
+        print(f"import {module:<20}{elapsed:>9.1f} ms  (budget {budget:.0f} ms)")
+        if elapsed > budget:
+            failures.append(f"import {module} took {elapsed:.1f} ms > {budget} ms")
+        if module == "qawiremock":
+            heavy = sorted(
+                name for name in loaded if name.split(".")[0] in HEAVY_MODULES
+            )
+            if heavy:
+                failures.append(f"import qawiremock loaded {', '.join(heavy)}")
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+DEFAULT_THRESHOLD = 0.5
+CALIBRATION_ROUNDS = 7
+CALIBRATION_DOCUMENT = {
+    "mappings": [
+        {"id": str(index), "request": {"url": f"/api/{index}"}, "response": {}}
+        for index in range(2_000)
+    ]
+}
+
+
+class Benchmark(NamedTuple):
+    name: str
+    run: Callable[[], Any]
+    setup: Callable[[], Any] | None = None
+    prepare: Callable[[], Any] | None = None
+    iterations: int = 50
+
+
+class Result(NamedTuple):
+    name: str
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    ops_per_sec: float
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline_ms: float
+    current_ms: float
+    ratio: float
+
+
+def measure(benchmark: Benchmark, iterations: int | None = None) -> Result:
+    """
+    Time a benchmark.
+
+    `prepare` is called once and `setup` before every iteration, both untimed.
+
+    :param benchmark: The benchmark to run.
+    :param iterations: Override the number of iterations of the benchmark.
+    :return: The latency statistics, in milliseconds.
+    """
+    count = iterations or benchmark.iterations
+    timings = []
+    if benchmark.prepare:
+        benchmark.prepare()
+    for _ in range(count):
+        if benchmark.setup:
+            benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    mean = statistics.fmean(timings)
+    return Result(
+        name=benchmark.name,
+        iterations=count,
+        mean_ms=round(mean, 4),
+        p50_ms=round(timings[len(timings) // 2], 4),
+        p95_ms=round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 4),
+        ops_per_sec=round(1000 / mean, 2) if mean else 0.0,
+    )
+
+
+def calibrate() -> float:
+    """
+    Time a fixed serialization workload, to express results relative to the
+    speed of the machine.
+
+    :return: The median duration of the workload, in milliseconds.
+    """
+    timings = []
+    for _ in range(CALIBRATION_ROUNDS):
+        start = time.perf_counter()
+        json.loads(json.dumps(CALIBRATION_DOCUMENT))
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def save_results(results: list[Result], path: Path, calibration_ms: float) -> None:
+    """
+    Write results as JSON, with the environment they were measured in.
+
+    :param results: The benchmark results.
+    :param path: The output file.
+    :param calibration_ms: The duration of the calibration workload.
+    """
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration_ms": round(calibration_ms, 4),
+        "results": {result.name: result._asdict() for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def compare(
+    results: list[Result],
+    baseline_path: Path,
+    calibration_ms: float,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """
+    Compare results with a saved baseline.
+
+    Latencies are divided by the calibration time of their run, so that
+    baselines recorded on a faster or slower machine stay comparable.
+
+    :param results: The benchmark results.
+    :param baseline_path: A file written by `save_results`.
+    :param calibration_ms: The calibration time of the current run.
+    :param threshold: Allowed relative slowdown of the p50 latency.
+    :return: The benchmarks slower than the baseline beyond the threshold.
+    """
+    document = json.loads(baseline_path.read_text())
+    baseline = document["results"]
+    scale = calibration_ms / document.get("calibration_ms", calibration_ms)
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if not reference:
+            continue
+        ratio = result.p50_ms / (reference["p50_ms"] * scale)
+        if ratio > 1 + threshold:
+            regressions.append(
+                Regression(result.name, reference["p50_ms"], result.p50_ms, ratio)
+            )
+    return regressions
+
+
+def format_table(results: list[Result]) -> str:
+    """
+    Format results as a plain text table.
+
+    :param results: The benchmark results.
+    :return: The table.
+    """
+    header = f"{'benchmark':<44}{'iter':>6}{'mean ms':>11}{'p50 ms':>11}"
+    header += f"{'p95 ms':>11}{'ops/s':>11}"
+    rows = [
+        f"{r.name:<44}{r.iterations:>6}{r.mean_ms:>11.3f}{r.p50_ms:>11.3f}"
+        f"{r.p95_ms:>11.3f}{r.ops_per_sec:>11.1f}"
+        for r in results
+    ]
+    return "\n".join([header, *rows])
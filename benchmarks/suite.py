@@ -0,0 +1,243 @@
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.fake_server import FakeWiremock
+from benchmarks.runner import Benchmark
+from qawiremock import Scenario, Stub, WiremockClient
+from qawiremock.analytics import JournalColumns
+from qawiremock.context_manager import StubBatch, StubContextManager
+from qawiremock.cursor import JournalCursor
+from qawiremock.models import WireMockRequest, WireMockResponse
+
+JOURNAL_SIZES = (1_000, 10_000, 100_000)
+STUB_COUNT = 10
+TEARDOWN_STUBS = 20
+LARGE_BODY_ITEMS = 50_000
+CHECKPOINT_STUBS = 100
+ANALYTICS_ENTRIES = 100_000
+CURSOR_NEW_ENTRIES = 10
+
+
+def make_exchange(index: int = 0) -> tuple[WireMockRequest, WireMockResponse]:
+    """
+    Build a request pattern and a small JSON response.
+
+    :param index: Makes the request URL unique.
+    :return: The request and the response.
+    """
+    request = WireMockRequest(method="GET", url=f"bench/{index}")
+    response = WireMockResponse(status=200, json_body={"index": index})
+    return request, response
+
+
+def make_stub(index: int = 0, times: int = 0) -> Stub:
+    """
+    Build a stub with a small JSON response.
+
+    :param index: Makes the request URL unique.
+    :param times: Number of times to reply, 0 for every time.
+    :return: The Stub object.
+    """
+    request, response = make_exchange(index)
+    return Stub().when(request).reply(response, times=times)
+
+
+class Fixtures:
+    """
+    Untimed setup steps of the benchmarks, sharing their state.
+    """
+
+    def __init__(self, fake: FakeWiremock, client: WiremockClient) -> None:
+        self.fake: FakeWiremock = fake
+        self.client: WiremockClient = client
+        self.state: dict[str, Any] = {}
+
+    def fresh_stub(self, times: int = 0) -> None:
+        self.fake.reset()
+        self.state["stub"] = make_stub(times=times)
+
+    def created_stub(self, times: int = 0) -> None:
+        self.fresh_stub(times)
+        self.client.create_stub(self.state["stub"])
+
+    def large_stub(self) -> None:
+        self.fake.reset()
+        request, response = make_exchange()
+        response.json_body = {"items": list(range(LARGE_BODY_ITEMS))}
+        self.state["stub"] = Stub().when(request).reply(response, times=20)
+
+    def fresh_scenario(self) -> None:
+        self.fake.reset()
+        scenario = Scenario()
+        scenario.scenario_stubs = [make_stub(1), make_stub(0, times=5)]
+        self.state["scenario"] = scenario
+
+    def journal(self, size: int) -> Callable[[], None]:
+        def prepare() -> None:
+            self.fake.reset()
+            stubs = [make_stub(i) for i in range(STUB_COUNT)]
+            self.client.create_stubs(stubs)
+            self.fake.seed_journal(size, list(self.fake.mappings.values()))
+            self.state["stub"] = stubs[0]
+
+        return prepare
+
+    def fill_columns(self) -> None:
+        self.journal(ANALYTICS_ENTRIES)()
+        self.state["columns"] = columns = JournalColumns()
+        columns.extend(self.client.iter_journal())
+
+    def open_cursor(self) -> None:
+        self.journal(10_000)()
+        self.state["cursor"] = JournalCursor(self.client, skip_existing=True)
+
+    def seed_new_requests(self) -> None:
+        self.fake.seed_journal(CURSOR_NEW_ENTRIES, list(self.fake.mappings.values()))
+
+    def seed_stub_requests(self) -> None:
+        mapping = self.fake.mappings[self.state["stub"].ids[0]]
+        self.fake.seed_journal(100, [mapping])
+
+    def take_checkpoint(self) -> None:
+        self.fake.reset()
+        self.client.create_stubs([make_stub(i) for i in range(CHECKPOINT_STUBS)])
+        self.state["checkpoint"] = self.client.checkpoint()
+
+    def open_context(self) -> None:
+        self.fake.reset()
+        manager = StubContextManager(self.client)
+        for index in range(TEARDOWN_STUBS):
+            manager.create_stub(*make_exchange(index))
+        self.state["manager"] = manager
+
+    def open_batch(self) -> None:
+        self.fake.reset()
+        batch = StubBatch(self.client)
+        for index in range(TEARDOWN_STUBS):
+            batch.create_stub(*make_exchange(index))
+        batch.flush()
+        self.state["batch"] = batch
+
+
+def build_suite(fake: FakeWiremock, client: WiremockClient) -> list[Benchmark]:
+    """
+    Build the benchmarks against a running fake server.
+
+    :param fake: The fake WireMock server.
+    :param client: A client connected to the fake server.
+    :return: The benchmarks, in the order they should run.
+    """
+    fixtures = Fixtures(fake, client)
+    state = fixtures.state
+    offloading = WiremockClient(
+        fake.host, fake.port, session=client.session, body_file_threshold=64 * 1024
+    )
+    benchmarks = [
+        Benchmark(
+            "create_stub[times=100]",
+            lambda: client.create_stub(state["stub"]),
+            setup=lambda: fixtures.fresh_stub(times=100),
+        ),
+        Benchmark(
+            "create_stub[times=1000]",
+            lambda: client.create_stub(state["stub"]),
+            setup=lambda: fixtures.fresh_stub(times=1000),
+            iterations=10,
+        ),
+        Benchmark(
+            "create_stub[times=20,large_body]",
+            lambda: client.create_stub(state["stub"]),
+            setup=fixtures.large_stub,
+            iterations=10,
+        ),
+        Benchmark(
+            "create_stub[times=20,large_body,body_file]",
+            lambda: offloading.create_stub(state["stub"]),
+            setup=fixtures.large_stub,
+            iterations=10,
+        ),
+        Benchmark(
+            "get_stub[times=100]",
+            lambda: client.get_stub(state["stub"]),
+            prepare=lambda: fixtures.created_stub(times=100),
+        ),
+        Benchmark(
+            "delete_stub[times=100]",
+            lambda: client.delete_stub(state["stub"]),
+            setup=lambda: fixtures.created_stub(times=100),
+        ),
+        Benchmark(
+            "create_scenario",
+            lambda: client.create_scenario(state["scenario"]),
+            setup=fixtures.fresh_scenario,
+        ),
+    ]
+    for size in JOURNAL_SIZES:
+        benchmarks += [
+            Benchmark(
+                f"get_stub_requests[{size}]",
+                lambda: client.get_stub_requests(state["stub"]),
+                prepare=fixtures.journal(size),
+            ),
+            Benchmark(
+                f"verify[{size}]",
+                lambda: client.verify(state["stub"], at_least=1),
+                prepare=fixtures.journal(size),
+            ),
+        ]
+    benchmarks += [
+        Benchmark(
+            "get_requests[all=10000]",
+            lambda: client.get_requests(),
+            prepare=fixtures.journal(10_000),
+            iterations=5,
+        ),
+        Benchmark(
+            "get_journal[all=10000]",
+            lambda: client.get_journal(),
+            prepare=fixtures.journal(10_000),
+            iterations=5,
+        ),
+        Benchmark(
+            f"JournalCursor.poll[10000+{CURSOR_NEW_ENTRIES}]",
+            lambda: state["cursor"].poll(),
+            setup=fixtures.seed_new_requests,
+            prepare=fixtures.open_cursor,
+        ),
+        Benchmark(
+            f"JournalColumns.stats[by=stub,{ANALYTICS_ENTRIES}]",
+            lambda: state["columns"].stats(by="stub"),
+            prepare=fixtures.fill_columns,
+            iterations=20,
+        ),
+        Benchmark(
+            f"JournalColumns.buckets[by=url,{ANALYTICS_ENTRIES}]",
+            lambda: state["columns"].buckets(1, by="url"),
+            prepare=fixtures.fill_columns,
+            iterations=20,
+        ),
+        Benchmark(
+            "delete_stub_requests[10000]",
+            lambda: client.delete_stub_requests(state["stub"]),
+            setup=fixtures.seed_stub_requests,
+            prepare=fixtures.journal(10_000),
+            iterations=20,
+        ),
+        Benchmark(
+            f"restore[{CHECKPOINT_STUBS}]",
+            lambda: client.restore(state["checkpoint"]),
+            setup=fake.reset,
+            prepare=fixtures.take_checkpoint,
+        ),
+        Benchmark(
+            f"StubContextManager.__exit__[{TEARDOWN_STUBS}]",
+            lambda: state["manager"].__exit__(None, None, None),
+            setup=fixtures.open_context,
+        ),
+        Benchmark(
+            f"StubBatch.close[{TEARDOWN_STUBS}]",
+            lambda: state["batch"].close(),
+            setup=fixtures.open_batch,
+        ),
+    ]
+    return benchmarks
@@ -1,7 +1,27 @@
-from qawiremock.client import Scenario, Stub, WiremockClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from qawiremock.client import Scenario, Stub, WiremockClient
 
 __all__ = [
     "WiremockClient",
     "Stub",
     "Scenario",
 ]
+
+# The client, with requests and pydantic, is imported on first attribute access.
+_LAZY_ATTRIBUTES = {name: "qawiremock.client" for name in __all__}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,279 @@
+import math
+from array import array
+from collections.abc import Hashable, Iterable, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal, NamedTuple
+
+from qawiremock.journal import JournalEntry
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+GroupBy = Literal["stub", "url"] | None
+Metric = Literal["total_time", "serve_time", "process_time", "added_delay"]
+DEFAULT_ERROR_STATUS = 500
+
+
+class LatencyStats(NamedTuple):
+    """Latency percentiles (ms), error rate and throughput (requests/s)."""
+
+    requests: int
+    errors: int
+    error_rate: float
+    throughput: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def rank(count: int, fraction: float) -> int:
+    """
+    Get the index of a percentile in sorted values, by nearest rank.
+
+    :param count: The number of values.
+    :param fraction: The percentile, from 0.0 to 1.0.
+    :return: The index of the percentile value.
+    """
+    return max(0, math.ceil(fraction * count) - 1)
+
+
+def summarize(
+    values: Sequence[float],
+    requests: int,
+    errors: int,
+    span: float,
+    window: float | None,
+) -> LatencyStats:
+    """
+    Build the statistics of a group from its sorted latencies.
+
+    :param values: The known latencies of the group, sorted. Requests logged
+        without timing are counted but have no latency.
+    :param requests: The number of requests of the group.
+    :param errors: The number of failed requests of the group.
+    :param span: Milliseconds between the first and the last request.
+    :param window: Duration of the group in seconds, for time buckets.
+    :return: The statistics, with NaN latencies when none is known.
+    """
+    count = len(values)
+    seconds = window if window is not None else span / 1000
+
+    def percentile(fraction: float) -> float:
+        return float(values[rank(count, fraction)]) if count else math.nan
+
+    return LatencyStats(
+        requests=requests,
+        errors=errors,
+        error_rate=errors / requests,
+        throughput=requests / seconds if seconds > 0 else 0.0,
+        mean=math.fsum(values) / count if count else math.nan,
+        p50=percentile(0.5),
+        p95=percentile(0.95),
+        p99=percentile(0.99),
+        max=percentile(1.0),
+    )
+
+
+def timing(value: int | None) -> float:
+    """
+    Convert a journal timing for columnar storage.
+
+    :param value: The timing in milliseconds, None when not logged.
+    :return: The timing, NaN when not logged.
+    """
+    return math.nan if value is None else float(value)
+
+
+class JournalColumns:
+    """
+    Columnar store of journal entries for latency analytics.
+
+    Entries are appended incrementally and deduplicated by id, so that
+    overlapping journal reads can be fed safely. Statistics are computed in
+    one grouped pass, vectorized with NumPy when it is installed.
+    """
+
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        """
+        :param use_numpy: Force or disable NumPy (default: use it if installed).
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.use_numpy: bool = np is not None if use_numpy is None else use_numpy
+        self.ids: set[str] = set()
+        self.logged_date: array[int] = array("q")
+        self.status: array[int] = array("q")
+        # Timings are NaN for requests logged without them.
+        self.total_time: array[float] = array("d")
+        self.serve_time: array[float] = array("d")
+        self.process_time: array[float] = array("d")
+        self.added_delay: array[float] = array("d")
+        self.stub: list[str | None] = []
+        self.url: list[str | None] = []
+
+    def __len__(self) -> int:
+        return len(self.logged_date)
+
+    def extend(self, entries: Iterable[JournalEntry]) -> int:
+        """
+        Append journal entries, skipping the already known ones.
+
+        :param entries: The entries, e.g. from `WiremockClient.iter_journal`.
+        :return: The number of new entries.
+        """
+        added = 0
+        for entry in entries:
+            if entry.id in self.ids:
+                continue
+            self.ids.add(entry.id)
+            self.logged_date.append(entry.logged_date or 0)
+            self.status.append(entry.status or 0)
+            self.total_time.append(timing(entry.total_time))
+            self.serve_time.append(timing(entry.serve_time))
+            self.process_time.append(timing(entry.process_time))
+            self.added_delay.append(timing(entry.added_delay))
+            self.stub.append(entry.stub_group or entry.stub_id)
+            self.url.append(entry.url)
+            added += 1
+        return added
+
+    def since(self) -> datetime | None:
+        """
+        Get the `since` filter to read only newer entries next time.
+
+        The filter is strict, so it starts one millisecond before the latest
+        entry: requests logged in the same millisecond are read again and
+        deduplicated by id instead of being lost.
+
+        :return: The date, or None when empty.
+        """
+        if not self.logged_date:
+            return None
+        start = max(self.logged_date) - 1
+        return datetime.fromtimestamp(0, timezone.utc) + timedelta(milliseconds=start)
+
+    def _keys(self, by: GroupBy) -> Sequence[Hashable]:
+        if by == "stub":
+            return self.stub
+        if by == "url":
+            return self.url
+        return [None] * len(self)
+
+    def stats(
+        self,
+        by: GroupBy = None,
+        metric: Metric = "total_time",
+        error_status: int = DEFAULT_ERROR_STATUS,
+    ) -> dict[Any, LatencyStats]:
+        """
+        Compute latency statistics per group.
+
+        :param by: Group by "stub", "url", or None for all requests.
+        :param metric: The timing field to analyse.
+        :param error_status: Statuses from this one on count as errors;
+            requests without a response have status 0 and count as errors.
+        :return: The statistics per group key.
+        """
+        return self._aggregate(self._keys(by), metric, error_status, None)
+
+    def buckets(
+        self,
+        width: float,
+        by: GroupBy = None,
+        metric: Metric = "total_time",
+        error_status: int = DEFAULT_ERROR_STATUS,
+    ) -> dict[tuple[int, Any], LatencyStats]:
+        """
+        Compute latency statistics per time window and group.
+
+        :param width: The window width, in seconds.
+        :param by: Group by "stub", "url", or None for all requests.
+        :param metric: The timing field to analyse.
+        :param error_status: Statuses from this one on count as errors.
+        :return: The statistics per (window start in epoch ms, group key),
+            throughput being computed over the window width.
+        """
+        step = max(1, int(width * 1000))
+        keys = [
+            (date - date % step, key)
+            for date, key in zip(self.logged_date, self._keys(by))
+        ]
+        return dict(sorted(self._aggregate(keys, metric, error_status, width).items()))
+
+    def _aggregate(
+        self,
+        keys: Sequence[Hashable],
+        metric: Metric,
+        error_status: int,
+        window: float | None,
+    ) -> dict[Any, LatencyStats]:
+        if not len(self):
+            return {}
+        if self.use_numpy:
+            return self._aggregate_numpy(keys, metric, error_status, window)
+        groups: dict[Any, list[int]] = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(key, []).append(index)
+        values = getattr(self, metric)
+        result = {}
+        for key, indexes in groups.items():
+            dates = [self.logged_date[i] for i in indexes]
+            errors = sum(
+                1
+                for i in indexes
+                if not self.status[i] or self.status[i] >= error_status
+            )
+            known = (values[i] for i in indexes if not math.isnan(values[i]))
+            result[key] = summarize(
+                sorted(known),
+                len(indexes),
+                errors,
+                max(dates) - min(dates),
+                window,
+            )
+        return result
+
+    def _aggregate_numpy(
+        self,
+        keys: Sequence[Hashable],
+        metric: Metric,
+        error_status: int,
+        window: float | None,
+    ) -> dict[Any, LatencyStats]:
+        codes_of: dict[Any, int] = {}
+        codes = np.fromiter(
+            (codes_of.setdefault(key, len(codes_of)) for key in keys),
+            dtype=np.intp,
+            count=len(keys),
+        )
+        values = np.frombuffer(getattr(self, metric), dtype=np.float64)
+        status = np.frombuffer(self.status, dtype=np.int64)
+        dates = np.frombuffer(self.logged_date, dtype=np.int64)
+
+        # One sort groups the entries and orders the latencies of each group,
+        # NaN (unknown) latencies last.
+        order = np.lexsort((values, codes))
+        sorted_values = values[order]
+        groups = len(codes_of)
+        starts = np.searchsorted(codes[order], np.arange(groups + 1))
+        known = np.bincount(codes, weights=~np.isnan(values), minlength=groups)
+        failed = (status == 0) | (status >= error_status)
+        errors = np.bincount(codes, weights=failed, minlength=groups)
+        first = np.minimum.reduceat(dates[order], starts[:-1])
+        last = np.maximum.reduceat(dates[order], starts[:-1])
+
+        result = {}
+        for key, code in codes_of.items():
+            start = int(starts[code])
+            result[key] = summarize(
+                sorted_values[start : start + int(known[code])].tolist(),
+                int(starts[code + 1]) - start,
+                int(errors[code]),
+                int(last[code] - first[code]),
+                window,
+            )
+        return result
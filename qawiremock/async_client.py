@@ -0,0 +1,414 @@
+import asyncio
+from collections.abc import Awaitable, Iterable
+from datetime import datetime
+from typing import Any, Self, TypeVar
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
+
+from qawiremock.client import (
+    Scenario,
+    Stub,
+    Urls,
+    assign_ids,
+    journal_query,
+    metadata_pattern,
+    newest_request,
+    prepare_import,
+    request_pattern,
+)
+from qawiremock.models import (
+    LoggedRequestsModel,
+    Meta,
+    RequestMappingModel,
+    RequestsCountModel,
+    RequestsHistoryModel,
+    StubMapping,
+    StubMappingRequestHistory,
+    WireMockRequest,
+    WiremockRequestsHistoryModel,
+)
+from qawiremock.report import Logger
+from qawiremock.transport import DEFAULT_POOL_SIZE
+
+T = TypeVar("T")
+
+
+class AsyncWiremockClient(Logger):
+    HTTP_TIMEOUT = 10
+    MAX_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 80,
+        timeout: int = HTTP_TIMEOUT,
+        session: ClientSession | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        concurrency: int = MAX_CONCURRENCY,
+    ) -> None:
+        """
+        :param host: Wiremock host.
+        :param port: Wiremock port (default: 80).
+        :param timeout: HTTP timeout in seconds.
+        :param session: Shared aiohttp session to use instead of creating one.
+            The client never closes a session it did not create.
+        :param pool_size: Maximum number of pooled connections.
+        :param concurrency: Maximum number of admin calls running at once.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.timeout: int = timeout
+        self.pool_size: int = pool_size
+        self._owns_session: bool = session is None
+        self._session: ClientSession | None = session
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the underlying session if it is owned by the client.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> ClientSession:
+        # The session is created lazily, since it must be bound to a running loop.
+        if self._session is None:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=self.pool_size),
+                timeout=ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def __get_base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _request(
+        self, method: str, path: str, attach: bool = True, **kwargs: Any
+    ) -> tuple[ClientResponse, Any]:
+        """
+        Send an admin call and decode its JSON body.
+
+        :raises aiohttp.ClientResponseError: If the status is not successful,
+            before the body is read.
+        :return: The response and its decoded JSON body, or None.
+        """
+        async with self._semaphore:
+            async with self.session.request(
+                method, f"{self.__get_base_url()}{path}", **kwargs
+            ) as response:
+                response.raise_for_status()
+                body: Any = None
+                if response.content_type == "application/json":
+                    body = await response.json()
+                else:
+                    await response.read()
+        if attach and body is not None:
+            self.attach_json_exchange(
+                url=str(response.url),
+                method=method,
+                status_code=response.status,
+                headers=dict(response.headers),
+                body=body,
+            )
+        return response, body
+
+    @staticmethod
+    async def _gather(calls: Iterable[Awaitable[T]]) -> list[T]:
+        return list(await asyncio.gather(*calls))
+
+    async def get_all_stubs(self) -> Any:
+        """
+        Retrieve all stubs from the Wiremock server.
+
+        :return: JSON response containing all stubs.
+        """
+        _, body = await self._request("GET", Urls.MAPPINGS)
+        return body
+
+    async def delete_all_stubs(self) -> ClientResponse:
+        """
+        Delete all stubs from the Wiremock server.
+
+        :return: The HTTP response object.
+        """
+        response, _ = await self._request("DELETE", Urls.MAPPINGS)
+        return response
+
+    async def get_stub(self, stub: Stub) -> RequestMappingModel:
+        """
+        Retrieve the mappings of a stub, found by its group tag with one call.
+
+        Mappings not tagged by this client are fetched concurrently by id.
+
+        :param stub: The stub to retrieve.
+        :return: All mappings of the stub in one model; in 0.1.0 this was
+            a list with one item per mapping id.
+        """
+        if not stub.managed:
+            results = await self._gather(
+                self._request("GET", f"{Urls.MAPPINGS}/{_id}") for _id in stub.ids
+            )
+            mappings = [StubMapping(**body) for _, body in results]
+            return RequestMappingModel(
+                meta=Meta(total=len(mappings)), mappings=mappings
+            )
+        _, body = await self._request(
+            "POST",
+            Urls.MAPPINGS_FIND_BY_METADATA,
+            json=metadata_pattern("stub", [stub.group_id]),
+        )
+        found = RequestMappingModel(**body)
+        ids = set(stub.ids)
+        found.mappings = [mapping for mapping in found.mappings if mapping.id in ids]
+        found.meta.total = len(found.mappings)
+        return found
+
+    async def create_stub(self, stub: Stub) -> Stub:
+        """
+        Create a specific stub in the Wiremock server.
+
+        :param stub: The stub to create.
+        :return: Stub object.
+        """
+        await self.create_stubs([stub])
+        return stub
+
+    async def create_stubs(self, stubs: list[Stub]) -> list[Stub]:
+        """
+        Create several stubs in the Wiremock server with a single import call.
+
+        :param stubs: The Stub objects to create.
+        :return: The list of created Stub objects.
+        """
+        payload, created = prepare_import(stubs)
+        if not created:
+            return stubs
+
+        await self._request("POST", Urls.MAPPINGS_IMPORT, json=payload)
+        assign_ids(created)
+        return stubs
+
+    async def delete_stub(self, stub: Stub) -> None:
+        """
+        Delete the mappings of a stub.
+
+        A stub owning its tagged group is removed with a single
+        remove-by-metadata call; other mappings are deleted concurrently by id.
+
+        :param stub: The stub to delete.
+        """
+        if stub.owns_group:
+            await self._request(
+                "POST",
+                Urls.MAPPINGS_REMOVE_BY_METADATA,
+                json=metadata_pattern("stub", [stub.group_id]),
+            )
+            return
+        await self._gather(
+            self._request("DELETE", f"{Urls.MAPPINGS}/{_id}") for _id in stub.ids
+        )
+
+    async def delete_tagged(self, tag: str, value: str, journal: bool = True) -> None:
+        """
+        Delete every mapping carrying a client tag, with a single call.
+
+        :param tag: The tag name, as given to `Stub.tag`.
+        :param value: The tag value.
+        :param journal: Also delete the requests served by these mappings.
+        """
+        pattern = metadata_pattern(tag, [value])
+        await self._request("POST", Urls.MAPPINGS_REMOVE_BY_METADATA, json=pattern)
+        if journal:
+            await self._request(
+                "POST", Urls.REQUESTS_REMOVE_BY_METADATA, attach=False, json=pattern
+            )
+
+    async def create_scenario(self, scenario: Scenario) -> list[Stub]:
+        """
+        Create a scenario with multiple stubs.
+
+        :param scenario: The Scenario object containing multiple stubs to be created.
+        :return: A list of Stub objects that were created.
+        """
+        return await self.create_stubs(scenario.scenario_stubs)
+
+    async def get_all_requests(self) -> WiremockRequestsHistoryModel:
+        """
+        Retrieve all requests made to the Wiremock server.
+
+        :return: A Root object containing all requests.
+        """
+        _, body = await self._request("GET", Urls.REQUESTS, attach=False)
+        return WiremockRequestsHistoryModel(**body)
+
+    async def get_requests(
+        self,
+        limit: int | None = None,
+        since: datetime | str | None = None,
+        matching_stub: str | None = None,
+        unmatched: bool = False,
+    ) -> WiremockRequestsHistoryModel:
+        """
+        Retrieve requests from the journal, filtered on the server side.
+
+        :param limit: Return at most this many of the most recent requests.
+        :param since: Return only requests logged after this moment.
+        :param matching_stub: Return only requests served by this mapping id.
+        :param unmatched: Return only requests that matched no stub.
+        :return: A Root object containing the matching requests.
+        """
+        _, body = await self._request(
+            "GET",
+            Urls.REQUESTS,
+            attach=False,
+            params=journal_query(limit, since, matching_stub, unmatched),
+        )
+        return WiremockRequestsHistoryModel(**body)
+
+    async def find_requests(
+        self,
+        pattern: WireMockRequest | None = None,
+        url: str | None = None,
+        method: str | None = None,
+    ) -> list[StubMappingRequestHistory]:
+        """
+        Find logged requests matching a request pattern.
+
+        :param pattern: The WireMockRequest to match.
+        :param url: The exact URL to match.
+        :param method: The HTTP method to match.
+        :return: A list of matching logged requests.
+        """
+        _, body = await self._request(
+            "POST",
+            Urls.REQUESTS_FIND,
+            attach=False,
+            json=request_pattern(pattern, url, method),
+        )
+        return LoggedRequestsModel(**body).requests
+
+    async def count_requests(
+        self,
+        pattern: WireMockRequest | None = None,
+        url: str | None = None,
+        method: str | None = None,
+    ) -> int:
+        """
+        Count logged requests matching a request pattern.
+
+        :param pattern: The WireMockRequest to match.
+        :param url: The exact URL to match.
+        :param method: The HTTP method to match.
+        :return: The number of matching requests.
+        """
+        _, body = await self._request(
+            "POST",
+            Urls.REQUESTS_COUNT,
+            attach=False,
+            json=request_pattern(pattern, url, method),
+        )
+        return RequestsCountModel(**body).count
+
+    async def get_stub_requests(self, stub: Stub) -> RequestsHistoryModel | None:
+        """
+        Retrieve the most recent request served by a specific stub.
+
+        :param stub: The Stub object whose requests are to be retrieved.
+        :return: The latest matching request, or None.
+        """
+        results = await self._gather(
+            self.get_requests(limit=1, matching_stub=_id) for _id in stub.ids
+        )
+        return newest_request(
+            [request for result in results for request in result.requests]
+        )
+
+    async def get_all_stub_requests(self, stub: Stub) -> list[RequestsHistoryModel]:
+        """
+        Retrieve all requests served by a specific stub, querying ids concurrently.
+
+        :param stub: The Stub object whose requests are to be retrieved.
+        :return: A list of matching requests.
+        """
+        results = await self._gather(
+            self.get_requests(matching_stub=_id) for _id in stub.ids
+        )
+        return [request for result in results for request in result.requests]
+
+    async def clear_history(self) -> None:
+        """
+        Delete all requests history
+        """
+        await self._request("DELETE", Urls.REQUESTS, attach=False)
+
+    async def delete_request_by_id(self, request_id: str) -> None:
+        """
+        Delete a specific request from the Wiremock server by its ID.
+
+        :param request_id: The unique identifier of the request to be deleted.
+        """
+        await self._request("DELETE", f"{Urls.REQUESTS}/{request_id}", attach=False)
+
+    async def delete_stub_requests(self, stub: Stub) -> None:
+        """
+        Delete requests associated with a given stub.
+
+        :param stub: The Stub object whose requests are to be deleted.
+        """
+        await self.delete_stubs_requests([stub])
+
+    async def delete_stubs_requests(self, stubs: list[Stub]) -> None:
+        """
+        Delete requests served by any of the given stubs.
+
+        Stubs owning their tagged group are cleared with a single call; the
+        requests of other stubs are looked up and deleted concurrently by id.
+
+        :param stubs: The Stub objects whose requests are to be deleted.
+        """
+        groups = [stub.group_id for stub in stubs if stub.owns_group]
+        if groups:
+            await self._request(
+                "POST",
+                Urls.REQUESTS_REMOVE_BY_METADATA,
+                attach=False,
+                json=metadata_pattern("stub", groups),
+            )
+        results = await self._gather(
+            self.get_all_stub_requests(stub) for stub in stubs if not stub.owns_group
+        )
+        await self._gather(
+            self.delete_request_by_id(request.id)
+            for requests in results
+            for request in requests
+        )
+
+    async def remove_requests(
+        self,
+        pattern: WireMockRequest | None = None,
+        url: str | None = None,
+        method: str | None = None,
+    ) -> None:
+        """
+        Delete all logged requests matching a request pattern with a single call.
+
+        :param pattern: The WireMockRequest to match.
+        :param url: The exact URL to match.
+        :param method: The HTTP method to match.
+        """
+        await self._request(
+            "POST",
+            Urls.REQUESTS_REMOVE,
+            attach=False,
+            json=request_pattern(pattern, url, method),
+        )
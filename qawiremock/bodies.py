@@ -0,0 +1,48 @@
+import base64
+import hashlib
+import json
+from typing import Any
+
+BODY_KEYS = ("jsonBody", "base64Body", "bodyAsBase64", "body")
+
+
+def extract_body(response: dict[str, Any]) -> tuple[bytes, str] | None:
+    """
+    Get the inline body of a response definition as bytes.
+
+    :param response: The response definition of a mapping.
+    :return: The body content and its file extension, or None without a body.
+    """
+    if response.get("jsonBody") is not None:
+        content = json.dumps(response["jsonBody"], separators=(",", ":"))
+        return content.encode(), "json"
+    for key in ("base64Body", "bodyAsBase64"):
+        if response.get(key):
+            return base64.b64decode(response[key]), "bin"
+    if response.get("body") is not None:
+        return str(response["body"]).encode(), "txt"
+    return None
+
+
+def body_file_name(content: bytes, extension: str) -> str:
+    """
+    Get the content-addressed name of a body file.
+
+    :param content: The file content.
+    :param extension: The file extension.
+    :return: The file name, relative to `__files`.
+    """
+    return f"qawiremock-{hashlib.sha256(content).hexdigest()}.{extension}"
+
+
+def reference_body_file(response: dict[str, Any], name: str) -> dict[str, Any]:
+    """
+    Replace the inline body of a response definition by a body file.
+
+    :param response: The response definition of a mapping.
+    :param name: The body file name, relative to `__files`.
+    :return: A new response definition using `bodyFileName`.
+    """
+    result = {key: value for key, value in response.items() if key not in BODY_KEYS}
+    result["bodyFileName"] = name
+    return result
@@ -0,0 +1,69 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+CHECKPOINT_VERSION = 1
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class Checkpoint(NamedTuple):
+    """
+    Snapshot of the server mappings, and optionally of the scenario states.
+
+    It can be kept in memory, or serialized to compact gzipped JSON.
+    """
+
+    mappings: list[dict[str, Any]]
+    scenarios: dict[str, str] | None = None
+
+    def dumps(self, compress: bool = True) -> bytes:
+        """
+        Serialize the checkpoint.
+
+        :param compress: Compress with gzip (default: True).
+        :return: The serialized checkpoint.
+        """
+        document = {
+            "version": CHECKPOINT_VERSION,
+            "mappings": self.mappings,
+            "scenarios": self.scenarios,
+        }
+        content = json.dumps(document, separators=(",", ":")).encode()
+        return gzip.compress(content, mtime=0) if compress else content
+
+    @classmethod
+    def loads(cls, data: bytes) -> "Checkpoint":
+        """
+        Deserialize a checkpoint, compressed or not.
+
+        :param data: The serialized checkpoint.
+        :return: The checkpoint.
+        """
+        if data[:2] == GZIP_MAGIC:
+            data = gzip.decompress(data)
+        document = json.loads(data)
+        if document.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version: {document.get('version')}"
+            )
+        return cls(document["mappings"], document.get("scenarios"))
+
+    def save(self, path: str | Path, compress: bool = True) -> None:
+        """
+        Write the checkpoint to a file.
+
+        :param path: The file path.
+        :param compress: Compress with gzip (default: True).
+        """
+        Path(path).write_bytes(self.dumps(compress))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Checkpoint":
+        """
+        Read a checkpoint from a file.
+
+        :param path: The file path.
+        :return: The checkpoint.
+        """
+        return cls.loads(Path(path).read_bytes())
@@ -1,26 +1,83 @@
+import hashlib
+import json
 import random
-from copy import deepcopy
+import re
+from collections.abc import Callable, Generator, Iterable
+from contextlib import closing
+from copy import copy
+from datetime import datetime, timezone
 from enum import StrEnum
+from time import monotonic, perf_counter, sleep
 from typing import Any, Self
+from urllib.parse import quote
+from uuid import uuid4
 
-from requests import Response, delete, get, post
+from requests import Response, Session
 
+from qawiremock.bodies import body_file_name, extract_body, reference_body_file
+from qawiremock.checkpoint import Checkpoint
+from qawiremock.index import IndexedGroup, MappingIndex, SyncResult
+from qawiremock.journal import JournalEntry, parse_journal
+from qawiremock.metrics import (
+    MetricsHook,
+    current_record,
+    instrumented,
+    instrumented_stream,
+    parsing,
+)
 from qawiremock.models import (
+    ChunkedDribbleDelay,
+    Fault,
+    LoggedRequestsModel,
+    LogNormalDelay,
     MappingModel,
+    Meta,
     RequestMappingModel,
+    RequestsCountModel,
+    RequestsHistoryModel,
+    ScenariosModel,
+    ScenarioStateModel,
+    StubMapping,
+    StubMappingRequestHistory,
+    UniformDelay,
     WireMockRequest,
     WiremockRequestsHistoryModel,
     WireMockResponse,
 )
+from qawiremock.registry import StubRegistry
 from qawiremock.report import Logger
+from qawiremock.streaming import DEFAULT_CHUNK_SIZE, iter_json_array
+from qawiremock.transport import DEFAULT_POOL_SIZE, create_session
 
 
 class Urls(StrEnum):
     MAPPINGS = "/__admin/mappings"
+    MAPPINGS_IMPORT = "/__admin/mappings/import"
+    MAPPINGS_FIND_BY_METADATA = "/__admin/mappings/find-by-metadata"
+    MAPPINGS_REMOVE_BY_METADATA = "/__admin/mappings/remove-by-metadata"
+    FILES = "/__admin/files"
     REQUESTS = "/__admin/requests"
+    SCENARIOS = "/__admin/scenarios"
+    SCENARIOS_RESET = "/__admin/scenarios/reset"
+    REQUESTS_FIND = "/__admin/requests/find"
+    REQUESTS_COUNT = "/__admin/requests/count"
+    REQUESTS_REMOVE = "/__admin/requests/remove"
+    REQUESTS_REMOVE_BY_METADATA = "/__admin/requests/remove-by-metadata"
+
+
+METADATA_KEY = "qawiremock"
+SCENARIO_STARTED = "Started"
 
 
 class Stub(Logger):
+    # Reassigning these fields invalidates the cached mapping.
+    _BASE_FIELDS = frozenset(
+        {"request", "response", "priority", "group_id", "metadata", "tags"}
+    )
+    _SCENARIO_FIELDS = frozenset(
+        {"scenario_name", "required_scenario_state", "new_scenario_state"}
+    )
+
     def __init__(
         self,
         request: WireMockRequest | None = None,
@@ -34,6 +91,74 @@ class Stub(Logger):
         self.new_scenario_state: str | None = None
         self.times: int = 0
         self.priority: int | None = None
+        self.group_id: str = uuid4().hex
+        self.metadata: dict[str, Any] = {}
+        self.tags: dict[str, str] = {}
+        self.limited_scenario_name: str | None = None
+        self.group_copy: bool = False
+
+    @property
+    def managed(self) -> bool:
+        """Whether the mappings of the stub carry its group tag. Stubs adopted
+        by `WiremockClient.sync` from foreign mappings use a mapping id as
+        group id instead."""
+        return bool(self.ids) and self.group_id not in self.ids
+
+    @property
+    def owns_group(self) -> bool:
+        """Whether the tagged group holds only the mappings of this stub,
+        unlike the copies made by `Scenario.limited_responses_stub`."""
+        return self.managed and not self.group_copy
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._BASE_FIELDS:
+            self.__dict__["_base_mapping"] = None
+            self.__dict__["_mapping"] = None
+        elif name in self._SCENARIO_FIELDS:
+            self.__dict__["_mapping"] = None
+        super().__setattr__(name, value)
+
+    def tag(self, **tags: str) -> Self:
+        """
+        Add client tags to the mapping metadata.
+
+        Tags are stored next to the stub group id and do not change the
+        stub fingerprint.
+
+        :param tags: Tag names and values.
+        :return: Self for chaining.
+        """
+        self.tags = {**self.tags, **tags}
+        return self
+
+    def invalidate_mapping(self) -> None:
+        """
+        Drop the cached mapping after the request, response or metadata
+        were changed in place.
+        """
+        self.__dict__["_base_mapping"] = None
+        self.__dict__["_mapping"] = None
+
+    def _get_base_mapping(self) -> dict[str, Any]:
+        base_mapping: dict[str, Any] | None = self.__dict__.get("_base_mapping")
+        if base_mapping is None:
+            base_mapping = {}
+            if self.request is not None and self.response is not None:
+                mapping_model = MappingModel(
+                    request=self.request,
+                    response=self.response,
+                )
+                base_mapping = mapping_model.model_dump(
+                    exclude_none=True, by_alias=True
+                )
+            if self.priority:
+                base_mapping["priority"] = self.priority
+            base_mapping["metadata"] = {
+                **self.metadata,
+                METADATA_KEY: {**self.tags, "stub": self.group_id},
+            }
+            self.__dict__["_base_mapping"] = base_mapping
+        return base_mapping
 
     def when(self, request: WireMockRequest) -> Self:
         """
@@ -52,16 +177,31 @@ class Stub(Logger):
         response: WireMockResponse,
         times: int = 0,
         priority: int | None = None,
+        delay: LogNormalDelay | UniformDelay | None = None,
+        dribble: ChunkedDribbleDelay | None = None,
+        fault: Fault | None = None,
     ) -> Self:
         """
         Set the response for the stub, along with optional times and priority.
         :param response: The Response object to reply with.
         :param times: Number of times to reply. 0 means reply every time (default: 0).
         :param priority: The priority of the response (optional).
+        :param delay: Random delay distribution of the response (optional).
+        :param dribble: Send the body in chunks over a duration (optional).
+        :param fault: Fail the response at the network level (optional).
         :return: Self for chaining.
 
         if times == 0 -> reply every time
+        The delay, dribble and fault are applied to a copy of the response.
         """
+        overrides = {
+            "delay_distribution": delay,
+            "chunked_dribble_delay": dribble,
+            "fault": fault,
+        }
+        overrides = {key: value for key, value in overrides.items() if value}
+        if overrides:
+            response = response.model_copy(update=overrides)
         self.times = times
         self.response = response
         self.attach_stub_response(self.response)
@@ -72,29 +212,54 @@ class Stub(Logger):
         """
         Get a dictionary representation of the stub mapping.
 
+        The mapping is cached until one of its fields is reassigned. Nested
+        values are shared between calls and with copies of the stub, so they
+        must not be modified.
+
         :return: A dictionary representing the stub mapping.
         """
-        mapping = {}
+        mapping: dict[str, Any] | None = self.__dict__.get("_mapping")
+        if mapping is None:
+            mapping = dict(self._get_base_mapping())
+            if self.scenario_name:
+                mapping.update(
+                    {
+                        "scenarioName": self.scenario_name,
+                        "requiredScenarioState": self.required_scenario_state,
+                    }
+                )
+                if self.new_scenario_state:
+                    mapping["newScenarioState"] = self.new_scenario_state
+                metadata = mapping["metadata"]
+                mapping["metadata"] = {
+                    **metadata,
+                    METADATA_KEY: {
+                        **metadata[METADATA_KEY],
+                        "scenario": self.scenario_name,
+                    },
+                }
+            self.__dict__["_mapping"] = mapping
+        return dict(mapping)
 
-        if self.request is not None and self.response is not None:
-            mapping_model = MappingModel(
-                request=self.request,
-                response=self.response,
-            )
-            mapping = mapping_model.model_dump(exclude_none=True, by_alias=True)
+    def fingerprint(self) -> str:
+        """
+        Get a content hash of the stub.
 
-        if self.scenario_name:
-            mapping.update(
-                {
-                    "scenarioName": self.scenario_name,
-                    "requiredScenarioState": self.required_scenario_state,
-                }
-            )
-            if self.new_scenario_state:
-                mapping["newScenarioState"] = self.new_scenario_state
-        if self.priority:
-            mapping["priority"] = self.priority
-        return mapping
+        Stubs with the same request, response, priority, scenario fields, user
+        metadata and times have the same fingerprint, whatever their group.
+
+        :return: The hex digest of the stub content.
+        """
+        mapping = self.get_mapping()
+        mapping["metadata"] = {
+            key: value
+            for key, value in mapping["metadata"].items()
+            if key != METADATA_KEY
+        }
+        content = json.dumps(
+            [mapping, self.times], sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
 
 
 class Scenario:
@@ -130,68 +295,339 @@ class Scenario:
         :param times: The number of times the stub should respond (default is 1).
         :return: A list of Stub objects configured for limited responses.
         """
+        # Copies share the request, the response and their serialized mapping.
+        stub._get_base_mapping()
         for time in range(times):
-            s: Stub = deepcopy(stub)
+            s: Stub = copy(stub)
+            s.ids = []
+            s.group_copy = True
             s.scenario_name = self.name
             s.new_scenario_state = f"state_{time + 1}"
             s.required_scenario_state = "Started" if time == 0 else f"state_{time}"
             self.scenario_stubs.append(s)
+        if times:
+            stub.limited_scenario_name = self.name
         if not self.scenario_stubs:
             self.scenario_stubs.append(stub)
         return self.scenario_stubs
 
+    def names(self) -> list[str]:
+        """
+        Get the names of all server-side scenarios used by this scenario.
+
+        Besides its own name, this includes the scenarios generated for stubs
+        with limited responses.
+
+        :return: A list of scenario names.
+        """
+        names = {self.name: None}
+        for stub in self.scenario_stubs:
+            if stub.limited_scenario_name:
+                names[stub.limited_scenario_name] = None
+        return list(names)
+
+
+def prepare_import(
+    stubs: list[Stub],
+    rewrite_response: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+) -> tuple[dict[str, Any], list[tuple[Stub, list[str]]]]:
+    """
+    Build the mappings import payload for the given stubs.
+
+    :param stubs: The Stub objects to import.
+    :param rewrite_response: Transforms the response definition of each stub,
+        once for all the mappings of a stub with limited responses.
+    :return: The import payload and the generated mapping ids of every stub,
+        or an empty list when there is nothing to import.
+    """
+    mappings: list[dict[str, Any]] = []
+    created: list[tuple[Stub, list[str]]] = []
+    for stub in stubs:
+        ids: list[str] = []
+        response: dict[str, Any] | None = None
+        for s in Scenario().limited_responses_stub(stub, stub.times):
+            _id = str(uuid4())
+            mapping = {**s.get_mapping(), "id": _id, "uuid": _id}
+            if rewrite_response is not None:
+                if response is None:
+                    response = rewrite_response(mapping["response"])
+                mapping["response"] = response
+            mappings.append(mapping)
+            ids.append(_id)
+        created.append((stub, ids))
+    return import_payload(mappings), created if mappings else []
+
+
+def import_payload(
+    mappings: list[dict[str, Any]], delete_all_not_in_import: bool = False
+) -> dict[str, Any]:
+    """
+    Build the body of a mappings import call.
+
+    :param mappings: The mappings to import; mappings with a known id overwrite it.
+    :param delete_all_not_in_import: Delete every other mapping on the server.
+    :return: The import payload.
+    """
+    return {
+        "mappings": mappings,
+        "importOptions": {
+            "duplicatePolicy": "OVERWRITE",
+            "deleteAllNotInImport": delete_all_not_in_import,
+        },
+    }
+
+
+def assign_ids(created: list[tuple[Stub, list[str]]]) -> None:
+    """
+    Store the ids of imported mappings in their stubs.
+
+    :param created: The stubs and ids returned by `prepare_import`.
+    """
+    for stub, ids in created:
+        if stub.times > 1:
+            stub.ids = []
+        stub.ids.extend(ids)
+
+
+def request_pattern(
+    pattern: WireMockRequest | None = None,
+    url: str | None = None,
+    method: str | None = None,
+) -> dict[str, Any]:
+    """
+    Build a request pattern for the journal query endpoints.
+
+    :param pattern: The WireMockRequest to match, as used in stub mappings.
+    :param url: The exact URL to match; overrides the pattern URL.
+    :param method: The HTTP method to match; overrides the pattern method.
+    :return: The request pattern as a dictionary.
+    """
+    body: dict[str, Any] = (
+        pattern.model_dump(exclude_none=True, by_alias=True) if pattern else {}
+    )
+    if url is not None:
+        body["url"] = url
+    if method is not None:
+        body["method"] = method
+    body.setdefault("method", "ANY")
+    return body
+
+
+def metadata_pattern(field: str, values: Iterable[str]) -> dict[str, Any]:
+    """
+    Build a metadata matcher for mappings tagged by the client.
+
+    :param field: The field under the client's metadata key, e.g. "stub".
+    :param values: The accepted values of the field.
+    :return: The metadata pattern as a dictionary.
+    """
+    unique = list(dict.fromkeys(values))
+    expression = f"$.{METADATA_KEY}.{field}"
+    if len(unique) == 1:
+        return {"matchesJsonPath": {"expression": expression, "equalTo": unique[0]}}
+    return {
+        "matchesJsonPath": {
+            "expression": expression,
+            "matches": "|".join(re.escape(value) for value in unique),
+        }
+    }
+
+
+def newest_request(
+    requests: list[RequestsHistoryModel],
+) -> RequestsHistoryModel | None:
+    """
+    Get the most recently logged of several journal entries.
+
+    :param requests: The entries, e.g. the latest one of every stub mapping.
+    :return: The entry with the greatest logged date, or None.
+    """
+    return max(
+        requests, key=lambda request: request.request.logged_date or 0, default=None
+    )
+
+
+def journal_query(
+    limit: int | None = None,
+    since: datetime | str | None = None,
+    matching_stub: str | None = None,
+    unmatched: bool = False,
+) -> dict[str, Any]:
+    """
+    Build query parameters for the request journal endpoint.
+
+    :param limit: Return at most this many of the most recent requests.
+    :param since: Return only requests logged after this moment.
+        Naive datetimes are treated as local time.
+    :param matching_stub: Return only requests served by this mapping id.
+    :param unmatched: Return only requests that matched no stub.
+    :return: The query parameters as a dictionary.
+    """
+    params: dict[str, Any] = {}
+    if limit is not None:
+        params["limit"] = limit
+    if isinstance(since, datetime):
+        params["since"] = since.astimezone(timezone.utc).isoformat(
+            timespec="milliseconds"
+        )
+    elif since is not None:
+        params["since"] = since
+    if matching_stub is not None:
+        params["matchingStub"] = matching_stub
+    if unmatched:
+        params["unmatched"] = "true"
+    return params
+
 
 class WiremockClient(Logger):
     HTTP_TIMEOUT = 10
 
-    def __init__(self, host: str, port: int = 80, timeout: int = HTTP_TIMEOUT) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int = 80,
+        timeout: int = HTTP_TIMEOUT,
+        session: Session | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        retries: int = 0,
+        backoff_factor: float = 0.0,
+        gzip: bool = True,
+        registry: StubRegistry | None = None,
+        hooks: Iterable[MetricsHook] | None = None,
+        body_file_threshold: int | None = None,
+    ) -> None:
+        """
+        :param host: Wiremock host.
+        :param port: Wiremock port (default: 80).
+        :param timeout: HTTP timeout in seconds.
+        :param session: Shared session to use instead of creating a new one.
+            The client never closes a session it did not create.
+        :param pool_size: Maximum number of pooled connections.
+        :param keep_alive: Keep connections open between calls.
+        :param retries: Number of retries for idempotent calls.
+        :param backoff_factor: Backoff factor between retries, in seconds.
+        :param gzip: Ask the server for gzip-compressed responses.
+        :param registry: Share server mappings between identical stubs.
+        :param hooks: Callables receiving a CallRecord after every operation.
+        :param body_file_threshold: Upload response bodies of this many bytes
+            or more as body files, referenced by the mappings (default: off).
+        """
         self.host: str = host
         self.port: int = port
         self.timeout: int = timeout
+        self._owns_session: bool = session is None
+        self.session: Session = session or create_session(
+            pool_size=pool_size,
+            keep_alive=keep_alive,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            gzip=gzip,
+        )
+        self.registry: StubRegistry | None = registry
+        self.index: MappingIndex = MappingIndex(METADATA_KEY)
+        self.hooks: list[MetricsHook] = list(hooks or ())
+        self.body_file_threshold: int | None = body_file_threshold
+        self.body_files: set[str] = set()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying session if it is owned by the client.
+        """
+        if self._owns_session:
+            self.session.close()
 
     def __get_base_url(self) -> str:
         return f"http://{self.host}:{self.port}"
 
+    def _request(self, method: str, path: str, **kwargs: Any) -> Response:
+        kwargs.setdefault("timeout", self.timeout)
+        url = f"{self.__get_base_url()}{path}"
+        record = current_record()
+        if record is None:
+            return self.session.request(method, url, **kwargs)
+        start = perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        record.add_call(response, perf_counter() - start, kwargs.get("stream", False))
+        return response
+
+    @instrumented
     def get_all_stubs(self) -> Any:
         """
         Retrieve all stubs from the Wiremock server.
 
+        The local mapping index is rebuilt from the result.
+
         :return: JSON response containing all stubs.
         """
-        response: Response = get(
-            f"{self.__get_base_url()}{Urls.MAPPINGS}", timeout=self.timeout
-        )
+        response: Response = self._request("GET", Urls.MAPPINGS)
         self.attach_response(response)
-        return response.json()
+        with parsing():
+            body = response.json()
+        self.index.load(body.get("mappings", []))
+        return body
 
+    @instrumented
     def delete_all_stubs(self) -> Response:
         """
         Delete all stubs from the Wiremock server.
 
         :return: The HTTP response object.
         """
-        response = delete(
-            f"{self.__get_base_url()}{Urls.MAPPINGS}", timeout=self.timeout
-        )
+        response = self._request("DELETE", Urls.MAPPINGS)
         self.attach_response(response)
+        if self.registry is not None:
+            self.registry.clear()
+        self.index.clear()
         return response
 
-    def get_stub(self, stub: Stub) -> Any:
+    @instrumented
+    def get_stub(self, stub: Stub) -> RequestMappingModel:
         """
-        Retrieve a specific stub by its ID from the Wiremock server.
+        Retrieve the mappings of a stub from the Wiremock server.
 
-        :param stub: The ID of the stub to retrieve.
-        :return: JSON response containing the requested stub.
+        Mappings created by this client are found by their stub group tag
+        with a single call, whatever the number of limited responses.
+        Untagged mappings are fetched one by one.
+
+        :param stub: The Stub object to retrieve.
+        :return: All mappings of the stub in one model; in 0.1.0 this was
+            a list with one item per mapping id.
         """
-        wrapped_response = []
-        for _id in stub.ids:
-            response = get(
-                f"{self.__get_base_url()}{Urls.MAPPINGS}/{_id}", timeout=self.timeout
-            )
-            wrapped_response.append(RequestMappingModel(**response.json()))
+        if not stub.managed:
+            return self._get_mappings(stub.ids)
+        response = self._request(
+            "POST",
+            Urls.MAPPINGS_FIND_BY_METADATA,
+            json=metadata_pattern("stub", [stub.group_id]),
+        )
+        self.attach_response(response)
+        with parsing():
+            found = RequestMappingModel.model_validate_json(response.content)
+        # Copies of a stub made by Scenario.limited_responses_stub share its group.
+        ids = set(stub.ids)
+        found.mappings = [mapping for mapping in found.mappings if mapping.id in ids]
+        found.meta.total = len(found.mappings)
+        return found
+
+    def _get_mappings(self, ids: list[str]) -> RequestMappingModel:
+        mappings = []
+        for _id in ids:
+            response = self._request("GET", f"{Urls.MAPPINGS}/{_id}")
             self.attach_response(response)
-        return wrapped_response
+            with parsing():
+                mappings.append(StubMapping.model_validate_json(response.content))
+        return RequestMappingModel(meta=Meta(total=len(mappings)), mappings=mappings)
 
+    @instrumented
     def create_stub(self, stub: Stub) -> Stub:
         """
         Create a specific stub in the Wiremock server.
@@ -199,103 +635,854 @@ class WiremockClient(Logger):
         :param stub: The ID of the stub to retrieve.
         :return: Stub objest.
         """
+        self.create_stubs([stub])
+        return stub
+
+    @instrumented
+    def create_stubs(self, stubs: list[Stub]) -> list[Stub]:
+        """
+        Create several stubs in the Wiremock server with a single import call.
 
-        stubs: list[Stub] = Scenario().limited_responses_stub(stub, stub.times)
-        if stub.times > 1:
-            stub.ids = []
-        for s in stubs:
-            response = post(
-                f"{self.__get_base_url()}{Urls.MAPPINGS}",
-                json=s.get_mapping(),
-                timeout=self.timeout,
+        Mapping ids are generated on the client side, because the import
+        endpoint does not return them, and are stored in each `Stub.ids`.
+
+        With a registry, stubs identical to already created ones reuse their
+        mappings and only the new ones are sent.
+
+        :param stubs: The Stub objects to create.
+        :return: The list of created Stub objects.
+        """
+        pending, fingerprints, duplicates = self._acquire_registered(stubs)
+        rewrite = self._offload_body if self.body_file_threshold is not None else None
+        payload, created = prepare_import(pending, rewrite)
+        if not created:
+            return stubs
+
+        response = self._request("POST", Urls.MAPPINGS_IMPORT, json=payload)
+        self.attach_response(response)
+        response.raise_for_status()
+        assign_ids(created)
+        self._register_created(created, fingerprints, duplicates)
+        mappings = {mapping["id"]: mapping for mapping in payload["mappings"]}
+        for stub, ids in created:
+            for _id in ids:
+                self.index.add(mappings[_id], stub, fingerprints.get(stub.group_id))
+        return stubs
+
+    def _offload_body(self, response: dict[str, Any]) -> dict[str, Any]:
+        """Upload a large inline body once, keyed by its hash, and reference it."""
+        body = extract_body(response)
+        if body is None or len(body[0]) < (self.body_file_threshold or 0):
+            return response
+        content, extension = body
+        name = body_file_name(content, extension)
+        if name not in self.body_files:
+            self.upload_file(name, content)
+            self.body_files.add(name)
+        return reference_body_file(response, name)
+
+    def _acquire_registered(
+        self, stubs: list[Stub]
+    ) -> tuple[list[Stub], dict[str, str], list[Stub]]:
+        """Attach stubs to registered mappings and return the ones to create,
+        their fingerprints by group id, and in-batch duplicates."""
+        if self.registry is None:
+            return stubs, {}, []
+        pending: list[Stub] = []
+        fingerprints: dict[str, str] = {}
+        seen: set[str] = set()
+        duplicates: list[Stub] = []
+        for stub in stubs:
+            if self.registry.is_shareable(stub):
+                fingerprint = stub.fingerprint()
+                if self.registry.acquire(stub, fingerprint):
+                    continue
+                if fingerprint in seen:
+                    duplicates.append(stub)
+                    continue
+                seen.add(fingerprint)
+                fingerprints[stub.group_id] = fingerprint
+            pending.append(stub)
+        return pending, fingerprints, duplicates
+
+    def _register_created(
+        self,
+        created: list[tuple[Stub, list[str]]],
+        fingerprints: dict[str, str],
+        duplicates: list[Stub],
+    ) -> None:
+        if self.registry is None:
+            return
+        for stub, ids in created:
+            if stub.group_id in fingerprints:
+                self.registry.register(stub, fingerprints[stub.group_id], ids)
+        for stub in duplicates:
+            self.registry.acquire(stub, stub.fingerprint())
+
+    @instrumented
+    def import_mappings(
+        self, mappings: list[dict[str, Any]], delete_all_not_in_import: bool = False
+    ) -> None:
+        """
+        Import raw mappings with a single call and add them to the index.
+
+        :param mappings: The mappings as dictionaries, each with an id.
+        :param delete_all_not_in_import: Delete every other mapping on the server.
+        """
+        response = self._request(
+            "POST",
+            Urls.MAPPINGS_IMPORT,
+            json=import_payload(mappings, delete_all_not_in_import),
+        )
+        self.attach_response(response)
+        response.raise_for_status()
+        if delete_all_not_in_import:
+            self.index.clear()
+            if self.registry is not None:
+                self.registry.clear()
+        for mapping in mappings:
+            self.index.remove(mapping["id"])
+            self.index.add(mapping)
+
+    @instrumented
+    def delete_mappings(self, ids: Iterable[str]) -> None:
+        """
+        Delete raw mappings by id; mappings already missing are ignored.
+
+        :param ids: The ids of the mappings to delete.
+        """
+        for _id in ids:
+            self._delete_mapping(_id)
+
+    @instrumented
+    def upload_file(self, name: str, content: bytes) -> None:
+        """
+        Create or replace a body file in the server `__files` directory.
+
+        :param name: The file path relative to `__files`.
+        :param content: The file content.
+        """
+        response = self._request("PUT", f"{Urls.FILES}/{name}", data=content)
+        response.raise_for_status()
+
+    @instrumented
+    def delete_stub(self, stub: Stub) -> None:
+        """
+        Delete the mappings of a stub from the Wiremock server.
+
+        Whole stub groups known to the local index are removed by their tag
+        with a single call; other mappings are deleted one by one. With a
+        registry, shared mappings are deleted only when their last user
+        releases them.
+
+        :param stub: The Stub object to delete.
+        """
+        ids = stub.ids if self.registry is None else self.registry.release(stub)
+        self._delete_mappings(ids)
+
+    def _delete_mappings(self, ids: list[str]) -> None:
+        groups = self.index.complete_groups(ids)
+        if groups:
+            response = self._request(
+                "POST",
+                Urls.MAPPINGS_REMOVE_BY_METADATA,
+                json=metadata_pattern("stub", groups),
             )
             self.attach_response(response)
-            _id: str = response.json()["uuid"]
-            stub.ids.append(_id)
-        return stub
+            response.raise_for_status()
+        removed = {
+            _id for group_id in groups for _id in self.index.remove_group(group_id)
+        }
+        for _id in ids:
+            if _id not in removed:
+                self._delete_mapping(_id)
 
-    def delete_stub(self, stub: Stub) -> None:
+    def _delete_mapping(self, mapping_id: str) -> None:
+        # A missing mapping is already deleted; other failures leave the
+        # local index untouched.
+        response = self._request("DELETE", f"{Urls.MAPPINGS}/{mapping_id}")
+        self.attach_response(response)
+        if response.status_code != 404:
+            response.raise_for_status()
+        self.index.remove(mapping_id)
+
+    @instrumented
+    def refresh_index(self) -> MappingIndex:
         """
-        Delete a specific stub by its ID from the Wiremock server.
+        Reload the local mapping index from the Wiremock server.
 
-        :param stub: The ID of the stub to retrieve.
-        :return: The HTTP response object.
+        :return: The refreshed index.
+        """
+        self.get_all_stubs()
+        return self.index
+
+    @instrumented
+    def sync(self, stubs: list[Stub], prune: bool = True) -> SyncResult:
+        """
+        Bring the server mappings to the desired set of stubs.
+
+        Desired stubs whose content is already on the server adopt the
+        existing mappings. The missing ones are created with one import call,
+        and the groups that are not desired any more are removed with one
+        remove-by-metadata call. The delta is computed on the local index,
+        so call `refresh_index` first if other clients changed the server.
+
+        :param stubs: The desired Stub objects.
+        :param prune: Also delete mappings not created by this library.
+        :return: The created and kept stubs and the deleted mapping ids.
         """
-        for _id in stub.ids:
-            response = delete(
-                f"{self.__get_base_url()}{Urls.MAPPINGS}/{_id}", timeout=self.timeout
+        available: dict[str, list[IndexedGroup]] = {}
+        for group in self.index.groups.values():
+            fingerprint = group.get_fingerprint()
+            if fingerprint is not None:
+                available.setdefault(fingerprint, []).append(group)
+
+        kept: list[Stub] = []
+        missing: list[Stub] = []
+        for stub in stubs:
+            fingerprint = stub.fingerprint()
+            if available.get(fingerprint):
+                group = available[fingerprint].pop()
+                group.stub = stub
+                stub.group_id = group.group_id
+                stub.ids = list(group.ids)
+                kept.append(stub)
+            else:
+                stub.tag(fingerprint=fingerprint)
+                missing.append(stub)
+
+        kept_groups = {stub.group_id for stub in kept}
+        stale = [
+            group
+            for group in self.index.groups.values()
+            if group.group_id not in kept_groups and (prune or group.managed)
+        ]
+        deleted = self._delete_groups(stale)
+        self.create_stubs(missing)
+        return SyncResult(created=missing, kept=kept, deleted=deleted)
+
+    def _delete_groups(self, groups: list[IndexedGroup]) -> list[str]:
+        tagged = [group.group_id for group in groups if group.managed]
+        if tagged:
+            response = self._request(
+                "POST",
+                Urls.MAPPINGS_REMOVE_BY_METADATA,
+                json=metadata_pattern("stub", tagged),
             )
             self.attach_response(response)
+            response.raise_for_status()
+        deleted: list[str] = []
+        for group in groups:
+            if not group.managed:
+                ids = list(group.ids)
+                for _id in ids:
+                    self._delete_mapping(_id)
+                deleted.extend(ids)
+            if self.registry is not None:
+                self.registry.forget(group.group_id)
+            deleted.extend(self.index.remove_group(group.group_id))
+        return deleted
 
+    @instrumented
+    def delete_tagged(self, tag: str, value: str, journal: bool = True) -> None:
+        """
+        Delete every mapping carrying a client tag, with a single call.
+
+        :param tag: The tag name, as given to `Stub.tag`.
+        :param value: The tag value.
+        :param journal: Also delete the requests served by these mappings.
+        """
+        pattern = metadata_pattern(tag, [value])
+        response = self._request("POST", Urls.MAPPINGS_REMOVE_BY_METADATA, json=pattern)
+        self.attach_response(response)
+        response.raise_for_status()
+        for group_id in self.index.tagged(tag, value):
+            if self.registry is not None:
+                self.registry.forget(group_id)
+            self.index.remove_group(group_id)
+        if journal:
+            response = self._request(
+                "POST", Urls.REQUESTS_REMOVE_BY_METADATA, json=pattern
+            )
+            self.attach_response(response)
+            response.raise_for_status()
+
+    @instrumented
     def create_scenario(self, scenario: Scenario) -> list[Stub]:
         """
         Create a scenario with multiple stubs.
 
+        All stubs of the scenario are sent in one import call.
+
         :param scenario: The Scenario object containing multiple stubs to be created.
         :return: A list of Stub objects that were created.
         """
-        for stub in scenario.scenario_stubs:
-            self.create_stub(stub)
-        return scenario.scenario_stubs
+        return self.create_stubs(scenario.scenario_stubs)
+
+    @instrumented
+    def register_scenario(self, scenario: Scenario) -> list[Stub]:
+        """
+        Create a scenario once and rewind it on the next calls.
+
+        If all mappings of the scenario are still known to the client, the
+        scenario states are reset instead of posting the stubs again.
+
+        :param scenario: The Scenario object to register.
+        :return: A list of the scenario Stub objects.
+        """
+        stubs = scenario.scenario_stubs
+        if stubs and all(
+            stub.ids and all(_id in self.index for _id in stub.ids) for stub in stubs
+        ):
+            self.reset_scenario(scenario)
+            return stubs
+        return self.create_scenario(scenario)
+
+    @instrumented
+    def get_scenarios(self) -> list[ScenarioStateModel]:
+        """
+        Retrieve all scenarios with their current states.
+
+        :return: A list of scenarios.
+        """
+        response = self._request("GET", Urls.SCENARIOS)
+        self.attach_response(response)
+        with parsing():
+            return ScenariosModel.model_validate_json(response.content).scenarios
+
+    @instrumented
+    def get_scenario_state(self, scenario: Scenario | Stub | str) -> str | None:
+        """
+        Retrieve the current state of a scenario.
+
+        :param scenario: A Scenario, a Stub with limited responses, or a name.
+        :return: The current state, or None if the scenario is unknown.
+        """
+        name = self._scenario_names(scenario)[0]
+        for item in self.get_scenarios():
+            if item.name == name:
+                return item.state
+        return None
+
+    @instrumented
+    def set_scenario_state(self, scenario: Scenario | Stub | str, state: str) -> None:
+        """
+        Move a scenario to the given state.
+
+        :param scenario: A Scenario, a Stub with limited responses, or a name.
+        :param state: The new scenario state.
+        """
+        name = self._scenario_names(scenario)[0]
+        response = self._request(
+            "PUT",
+            f"{Urls.SCENARIOS}/{quote(name, safe='')}/state",
+            json={"state": state},
+        )
+        self.attach_response(response)
+        response.raise_for_status()
+
+    @instrumented
+    def reset_scenario(self, scenario: Scenario | Stub | str) -> None:
+        """
+        Rewind a scenario, including its limited-responses scenarios, to Started.
+
+        WireMock only resets all scenarios at once, so each scenario name is
+        set back to Started instead, leaving the other scenarios of the server
+        untouched. Names are deduplicated, so stubs sharing a limited-responses
+        scenario cost one call; use `reset_all_scenarios` for a single call.
+
+        :param scenario: A Scenario, a Stub with limited responses, or a name.
+        """
+        for name in self._scenario_names(scenario):
+            self.set_scenario_state(name, SCENARIO_STARTED)
+
+    @instrumented
+    def reset_all_scenarios(self) -> None:
+        """
+        Rewind all scenarios on the server with a single call.
+        """
+        response = self._request("POST", Urls.SCENARIOS_RESET)
+        self.attach_response(response)
+
+    @instrumented
+    def checkpoint(self, scenarios: bool = False) -> Checkpoint:
+        """
+        Snapshot the mappings of the server, e.g. a module baseline.
+
+        :param scenarios: Also capture the current scenario states.
+        :return: The checkpoint, which can be saved with `Checkpoint.save`.
+        """
+        mappings = self.get_all_stubs().get("mappings", [])
+        states = None
+        if scenarios:
+            states = {
+                scenario.name: scenario.state for scenario in self.get_scenarios()
+            }
+        return Checkpoint(mappings, states)
+
+    @instrumented
+    def restore(self, checkpoint: Checkpoint) -> None:
+        """
+        Bring the server mappings back to a checkpoint.
+
+        All other mappings are deleted by the same import call. Captured
+        scenario states are restored after one reset of all scenarios.
+
+        :param checkpoint: A checkpoint returned by `checkpoint`.
+        """
+        self.import_mappings(checkpoint.mappings, delete_all_not_in_import=True)
+        if checkpoint.scenarios is None:
+            return
+        self.reset_all_scenarios()
+        for name, state in checkpoint.scenarios.items():
+            if state != SCENARIO_STARTED:
+                self.set_scenario_state(name, state)
 
+    @staticmethod
+    def _scenario_names(scenario: Scenario | Stub | str) -> list[str]:
+        if isinstance(scenario, Scenario):
+            return scenario.names()
+        if isinstance(scenario, Stub):
+            name = scenario.limited_scenario_name or scenario.scenario_name
+            if name is None:
+                raise ValueError("The stub does not belong to a scenario")
+            return [name]
+        return [scenario]
+
+    @instrumented
     def get_all_requests(self) -> WiremockRequestsHistoryModel:
         """
         Retrieve all requests made to the Wiremock server.
 
         :return: A Root object containing all requests.
         """
-        response = get(self.__get_base_url() + Urls.REQUESTS, timeout=self.timeout)
-        return WiremockRequestsHistoryModel(**response.json())
+        response = self._request("GET", Urls.REQUESTS)
+        response.raise_for_status()
+        with parsing():
+            return WiremockRequestsHistoryModel.model_validate_json(response.content)
+
+    @instrumented
+    def get_requests(
+        self,
+        limit: int | None = None,
+        since: datetime | str | None = None,
+        matching_stub: str | None = None,
+        unmatched: bool = False,
+    ) -> WiremockRequestsHistoryModel:
+        """
+        Retrieve requests from the journal, filtered on the server side.
 
-    def get_stub_requests(self, stub: Stub) -> Any:
+        :param limit: Return at most this many of the most recent requests.
+        :param since: Return only requests logged after this moment.
+        :param matching_stub: Return only requests served by this mapping id.
+        :param unmatched: Return only requests that matched no stub.
+        :return: A Root object containing the matching requests.
         """
-        Retrieve requests associated with a specific stub.
+        response = self._request(
+            "GET",
+            Urls.REQUESTS,
+            params=journal_query(limit, since, matching_stub, unmatched),
+        )
+        response.raise_for_status()
+        with parsing():
+            return WiremockRequestsHistoryModel.model_validate_json(response.content)
+
+    def _iter_events(
+        self,
+        limit: int | None,
+        since: datetime | str | None,
+        matching_stub: str | None,
+        unmatched: bool,
+        chunk_size: int,
+    ) -> Generator[dict[str, Any], None, None]:
+        with self._request(
+            "GET",
+            Urls.REQUESTS,
+            params=journal_query(limit, since, matching_stub, unmatched),
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            yield from iter_json_array(response.iter_content(chunk_size), "requests")
+
+    @instrumented_stream
+    def iter_requests(
+        self,
+        limit: int | None = None,
+        since: datetime | str | None = None,
+        matching_stub: str | None = None,
+        unmatched: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Generator[RequestsHistoryModel, None, None]:
+        """
+        Stream requests from the journal one entry at a time.
+
+        The response body is decoded incrementally, so memory stays bounded
+        by a single entry. Stopping the iteration closes the connection.
+
+        :param limit: Return at most this many of the most recent requests.
+        :param since: Return only requests logged after this moment.
+        :param matching_stub: Return only requests served by this mapping id.
+        :param unmatched: Return only requests that matched no stub.
+        :param chunk_size: Size of the chunks read from the socket, in bytes.
+        :return: An iterator over the journal entries, newest first.
+        """
+        with closing(
+            self._iter_events(limit, since, matching_stub, unmatched, chunk_size)
+        ) as events:
+            for event in events:
+                with parsing():
+                    request = RequestsHistoryModel.model_validate(event)
+                yield request
+
+    @instrumented
+    def get_journal(
+        self,
+        limit: int | None = None,
+        since: datetime | str | None = None,
+        matching_stub: str | None = None,
+        unmatched: bool = False,
+    ) -> list[JournalEntry]:
+        """
+        Retrieve requests from the journal as compact, unvalidated records.
+
+        Much cheaper than `get_requests` for large journals and bulk analysis.
+
+        :param limit: Return at most this many of the most recent requests.
+        :param since: Return only requests logged after this moment.
+        :param matching_stub: Return only requests served by this mapping id.
+        :param unmatched: Return only requests that matched no stub.
+        :return: The journal records, newest first.
+        """
+        response = self._request(
+            "GET",
+            Urls.REQUESTS,
+            params=journal_query(limit, since, matching_stub, unmatched),
+        )
+        response.raise_for_status()
+        with parsing():
+            return parse_journal(response.content, METADATA_KEY)
+
+    @instrumented_stream
+    def iter_journal(
+        self,
+        limit: int | None = None,
+        since: datetime | str | None = None,
+        matching_stub: str | None = None,
+        unmatched: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Generator[JournalEntry, None, None]:
+        """
+        Stream requests from the journal as compact, unvalidated records.
+
+        :param limit: Return at most this many of the most recent requests.
+        :param since: Return only requests logged after this moment.
+        :param matching_stub: Return only requests served by this mapping id.
+        :param unmatched: Return only requests that matched no stub.
+        :param chunk_size: Size of the chunks read from the socket, in bytes.
+        :return: An iterator over the journal records, newest first.
+        """
+        with closing(
+            self._iter_events(limit, since, matching_stub, unmatched, chunk_size)
+        ) as events:
+            for event in events:
+                yield JournalEntry.from_event(event, METADATA_KEY)
+
+    @instrumented
+    def find_request(
+        self,
+        predicate: Callable[[RequestsHistoryModel], bool],
+        since: datetime | str | None = None,
+        matching_stub: str | None = None,
+    ) -> RequestsHistoryModel | None:
+        """
+        Return the most recent journal entry matching a predicate.
+
+        The journal is streamed and reading stops at the first match.
+
+        :param predicate: A function returning True for the wanted entry.
+        :param since: Look only at requests logged after this moment.
+        :param matching_stub: Look only at requests served by this mapping id.
+        :return: The first matching request, or None.
+        """
+        with closing(
+            self.iter_requests(since=since, matching_stub=matching_stub)
+        ) as requests:
+            for request in requests:
+                if predicate(request):
+                    return request
+        return None
+
+    @instrumented
+    def find_requests(
+        self,
+        pattern: WireMockRequest | None = None,
+        url: str | None = None,
+        method: str | None = None,
+    ) -> list[StubMappingRequestHistory]:
+        """
+        Find logged requests matching a request pattern.
+
+        :param pattern: The WireMockRequest to match.
+        :param url: The exact URL to match.
+        :param method: The HTTP method to match.
+        :return: A list of matching logged requests.
+        """
+        response = self._request(
+            "POST", Urls.REQUESTS_FIND, json=request_pattern(pattern, url, method)
+        )
+        response.raise_for_status()
+        with parsing():
+            return LoggedRequestsModel.model_validate_json(response.content).requests
+
+    @instrumented
+    def count_requests(
+        self,
+        pattern: WireMockRequest | None = None,
+        url: str | None = None,
+        method: str | None = None,
+    ) -> int:
+        """
+        Count logged requests matching a request pattern.
+
+        :param pattern: The WireMockRequest to match.
+        :param url: The exact URL to match.
+        :param method: The HTTP method to match.
+        :return: The number of matching requests.
+        """
+        response = self._request(
+            "POST", Urls.REQUESTS_COUNT, json=request_pattern(pattern, url, method)
+        )
+        response.raise_for_status()
+        with parsing():
+            return RequestsCountModel.model_validate_json(response.content).count
+
+    @instrumented
+    def get_stub_requests(self, stub: Stub) -> RequestsHistoryModel | None:
+        """
+        Retrieve the most recent request served by a specific stub.
+
+        :param stub: The Stub object whose requests are to be retrieved.
+        :return: The latest matching request, or None.
+        """
+        latest = [
+            request
+            for stub_id in stub.ids
+            for request in self.get_requests(limit=1, matching_stub=stub_id).requests
+        ]
+        return newest_request(latest)
+
+    @instrumented
+    def get_all_stub_requests(self, stub: Stub) -> list[RequestsHistoryModel]:
+        """
+        Retrieve all requests served by a specific stub.
 
         :param stub: The Stub object whose requests are to be retrieved.
-        :return: A collection of requests.
+        :return: A list of matching requests.
+        """
+        return [
+            request
+            for stub_id in stub.ids
+            for request in self.get_requests(matching_stub=stub_id).requests
+        ]
+
+    @instrumented
+    def count_stub_requests(self, stub: Stub, limit: int | None = None) -> int:
         """
-        response = get(self.__get_base_url() + Urls.REQUESTS, timeout=self.timeout)
+        Count requests served by a specific stub.
+
+        Only the entries of the stub are transferred, and at most `limit`.
 
-        for request in WiremockRequestsHistoryModel(**response.json()).requests:
-            if request.request.headers is not None:
-                for stub_id in stub.ids:
-                    if (
-                        request.response
-                        and request.response.headers
-                        and stub_id == request.request.headers.matched_stub_Id
-                    ):
-                        return request
+        :param stub: The Stub object whose requests are counted.
+        :param limit: Stop counting at this number (optional).
+        :return: The number of requests, capped at `limit`.
+        """
+        total = 0
+        for stub_id in stub.ids:
+            remaining = None if limit is None else limit - total
+            response = self._request(
+                "GET",
+                Urls.REQUESTS,
+                params=journal_query(limit=remaining, matching_stub=stub_id),
+            )
+            response.raise_for_status()
+            with parsing():
+                total += len(response.json()["requests"])
+            if limit is not None and total >= limit:
+                return limit
+        return total
 
+    def _count(self, target: Stub | WireMockRequest, limit: int | None) -> int:
+        if isinstance(target, Stub):
+            return self.count_stub_requests(target, limit)
+        return self.count_requests(target)
+
+    @instrumented
+    def wait_for_requests(
+        self,
+        target: Stub | WireMockRequest,
+        count: int = 1,
+        timeout: float = HTTP_TIMEOUT,
+        interval: float = 0.05,
+        max_interval: float = 1.0,
+        backoff: float = 2.0,
+    ) -> int:
+        """
+        Wait until a stub served, or a request pattern matched, enough requests.
+
+        The journal is polled through counting queries, with an interval
+        growing exponentially up to `max_interval`.
+
+        :param target: A Stub object or a WireMockRequest pattern.
+        :param count: The number of requests to wait for (default: 1).
+        :param timeout: Maximum waiting time, in seconds.
+        :param interval: The first polling interval, in seconds.
+        :param max_interval: The longest polling interval, in seconds.
+        :param backoff: The interval multiplier between polls.
+        :return: The number of requests seen, at least `count`.
+        :raises TimeoutError: If fewer requests arrived before the timeout.
+        """
+        deadline = monotonic() + timeout
+        while True:
+            actual = self._count(target, count)
+            if actual >= count:
+                return actual
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Expected {count} requests within {timeout}s, got {actual}"
+                )
+            sleep(min(interval, remaining))
+            interval = min(interval * backoff, max_interval)
+
+    @instrumented
+    def verify(
+        self,
+        target: Stub | WireMockRequest,
+        exactly: int | None = None,
+        at_least: int | None = None,
+        at_most: int | None = None,
+        timeout: float = 0,
+    ) -> int:
+        """
+        Assert how many requests a stub served, or a request pattern matched.
+
+        Without bounds, at least one request is expected. The full journal is
+        never transferred: counting stops just above the highest bound.
+
+        :param target: A Stub object or a WireMockRequest pattern.
+        :param exactly: The exact number of expected requests.
+        :param at_least: The minimum number of expected requests.
+        :param at_most: The maximum number of expected requests.
+        :param timeout: Time to wait for the minimum to be reached, in seconds.
+        :return: The counted number of requests.
+        :raises AssertionError: If the count is out of bounds.
+        """
+        if exactly is None and at_least is None and at_most is None:
+            at_least = 1
+        minimum = exactly if exactly is not None else at_least
+        maximum = exactly if exactly is not None else at_most
+        if timeout and minimum:
+            try:
+                self.wait_for_requests(target, minimum, timeout)
+            except TimeoutError:
+                pass
+
+        bounds = [bound for bound in (minimum, maximum) if bound is not None]
+        actual = self._count(target, max(bounds) + 1)
+        if minimum is not None and actual < minimum:
+            raise AssertionError(f"Expected at least {minimum} requests, got {actual}")
+        if maximum is not None and actual > maximum:
+            raise AssertionError(
+                f"Expected at most {maximum} requests, got more than {maximum}"
+            )
+        return actual
+
+    @instrumented
     def clear_history(self) -> None:
         """
         Delete all requests history
         """
-        delete(self.__get_base_url() + Urls.REQUESTS, timeout=self.timeout)
+        response = self._request("DELETE", Urls.REQUESTS)
+        self.attach_response(response)
+        response.raise_for_status()
 
+    @instrumented
     def delete_request_by_id(self, request_id: str) -> None:
         """
         Delete a specific request from the Wiremock server by its ID.
 
         :param request_id: The unique identifier of the request to be deleted.
         """
-        delete(
-            self.__get_base_url() + Urls.REQUESTS + "/" + request_id,
-            timeout=self.timeout,
-        )
+        response = self._request("DELETE", f"{Urls.REQUESTS}/{request_id}")
+        self.attach_response(response)
+        response.raise_for_status()
 
+    @instrumented
     def delete_stub_requests(self, stub: Stub) -> None:
         """
         Delete requests associated with a given stub.
 
         :param stub: The Stub object whose requests are to be deleted.
         """
-        all_requests = get(
-            f"{self.__get_base_url()}{Urls.REQUESTS}", timeout=self.timeout
-        ).json()["requests"]
-        stub_requests_ids = [
-            request["id"]
-            for request in all_requests
-            if request["stubMapping"]["uuid"] in stub.ids
+        self.delete_stubs_requests([stub])
+
+    @instrumented
+    def delete_stubs_requests(self, stubs: list[Stub]) -> None:
+        """
+        Delete requests served by any of the given stubs.
+
+        Stubs owning their tagged group are cleared with a single call. The
+        requests of other stubs (limited-responses copies sharing a group,
+        adopted or untagged mappings) are deleted by id. With a registry, the
+        requests of a mapping still used by other stubs cannot be told apart
+        and a ValueError is raised.
+
+        :param stubs: The Stub objects whose requests are to be deleted.
+        """
+        if not stubs:
+            return
+        if self.registry is not None:
+            shared = [stub for stub in stubs if self.registry.users(stub) > 1]
+            if shared:
+                raise ValueError(
+                    f"{len(shared)} stub(s) share their mapping with other stubs, "
+                    "their requests cannot be deleted separately"
+                )
+        groups = [stub.group_id for stub in stubs if stub.owns_group]
+        if groups:
+            response = self._request(
+                "POST",
+                Urls.REQUESTS_REMOVE_BY_METADATA,
+                json=metadata_pattern("stub", groups),
+            )
+            self.attach_response(response)
+            response.raise_for_status()
+        request_ids = [
+            entry.id
+            for stub in stubs
+            if not stub.owns_group
+            for stub_id in stub.ids
+            for entry in self.iter_journal(matching_stub=stub_id)
         ]
-        for request_id in stub_requests_ids:
+        for request_id in request_ids:
             self.delete_request_by_id(request_id)
+
+    @instrumented
+    def remove_requests(
+        self,
+        pattern: WireMockRequest | None = None,
+        url: str | None = None,
+        method: str | None = None,
+    ) -> None:
+        """
+        Delete all logged requests matching a request pattern with a single call.
+
+        :param pattern: The WireMockRequest to match.
+        :param url: The exact URL to match.
+        :param method: The HTTP method to match.
+        """
+        response = self._request(
+            "POST", Urls.REQUESTS_REMOVE, json=request_pattern(pattern, url, method)
+        )
+        self.attach_response(response)
+        response.raise_for_status()
@@ -1,24 +1,37 @@
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
+from uuid import uuid4
 
-from qawiremock import Stub, WiremockClient
+from qawiremock import Scenario, Stub, WiremockClient
 from qawiremock.models import WireMockRequest, WireMockResponse
 
+if TYPE_CHECKING:
+    from qawiremock.async_client import AsyncWiremockClient
+
 
 class StubContextManager:
-    def __init__(
-        self,
-        mock_client: WiremockClient,
-    ) -> None:
+    def __init__(self, mock_client: WiremockClient, tag: str = "test") -> None:
+        """
+        :param mock_client: The client of the target server.
+        :param tag: The tag name holding the context id.
+        """
         self.mock_client: WiremockClient = mock_client
+        self.tag: str = tag
+        self.context_id: str = uuid4().hex
         self.stubs: list[Stub] = []
+        self.shared: list[Stub] = []
 
     def create_stub(
         self, stub_request: WireMockRequest, stub_response: WireMockResponse
     ) -> None:
         """Creates and registers a stub within the context manager."""
         stub = Stub().when(stub_request).reply(stub_response)
+        registry = self.mock_client.registry
+        if registry is not None and registry.is_shareable(stub):
+            self.shared.append(stub)
+        else:
+            stub.tag(**{self.tag: self.context_id})
+            self.stubs.append(stub)
         self.mock_client.create_stub(stub)
-        self.stubs.append(stub)
 
     def __enter__(self) -> Self:
         """Return self to allow creation of stubs within the context."""
@@ -27,7 +40,148 @@ class StubContextManager:
     def __exit__(
         self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
     ) -> None:
-        """Ensure all created stubs are deleted on exiting the context."""
-        for stub in self.stubs:
+        """
+        Delete the stubs created within the context with a single call by
+        their context tag; stubs shared through the registry are released.
+        """
+        if self.stubs:
+            self.mock_client.delete_tagged(self.tag, self.context_id, journal=False)
+        for stub in self.shared:
             self.mock_client.delete_stub(stub=stub)
+        for stub in self.stubs:
+            stub.ids = []
+        self.stubs.clear()
+        self.shared.clear()
+
+
+class StubBatch:
+    """
+    Stubs queued while a test is being set up and created with one call.
+
+    Every stub is tagged with the batch id, so that closing the batch deletes
+    all its mappings and their journal entries with one call each. Stubs
+    added after `flush` are created immediately. Stubs shared through the
+    client registry are released one by one instead, since other batches
+    may use their mappings.
+    """
+
+    def __init__(self, mock_client: WiremockClient, tag: str = "batch") -> None:
+        """
+        :param mock_client: The client of the target server.
+        :param tag: The tag name holding the batch id.
+        """
+        self.mock_client: WiremockClient = mock_client
+        self.tag: str = tag
+        self.batch_id: str = uuid4().hex
+        self.pending: list[Stub] = []
+        self.stubs: list[Stub] = []
+        self.shared: list[Stub] = []
+        self.flushed: bool = False
+
+    def add(self, stub: Stub) -> Stub:
+        """
+        Queue a stub, or create it if the batch was already flushed.
+
+        :param stub: The Stub object.
+        :return: The same Stub object, its ids are set once created.
+        """
+        registry = self.mock_client.registry
+        if registry is not None and registry.is_shareable(stub):
+            self.shared.append(stub)
+        else:
+            stub.tag(**{self.tag: self.batch_id})
+            self.stubs.append(stub)
+        self.pending.append(stub)
+        if self.flushed:
+            self.flush()
+        return stub
+
+    def create_stub(
+        self,
+        stub_request: WireMockRequest,
+        stub_response: WireMockResponse,
+        times: int = 0,
+    ) -> Stub:
+        """Build a stub and add it to the batch."""
+        return self.add(Stub().when(stub_request).reply(stub_response, times=times))
+
+    def add_scenario(self, scenario: Scenario) -> Scenario:
+        """
+        Queue all stubs of a scenario.
+
+        :param scenario: The Scenario object.
+        :return: The same Scenario object.
+        """
+        for stub in scenario.scenario_stubs:
+            self.add(stub)
+        return scenario
+
+    def flush(self) -> None:
+        """
+        Create all queued stubs with a single import call.
+        """
+        self.flushed = True
+        if self.pending:
+            pending, self.pending = self.pending, []
+            self.mock_client.create_stubs(pending)
+
+    def close(self) -> None:
+        """
+        Delete the created stubs and the requests they served.
+        """
+        self.pending.clear()
+        if self.stubs and self.flushed:
+            self.mock_client.delete_tagged(self.tag, self.batch_id)
+        for stub in self.shared:
+            self.mock_client.delete_stub(stub)
+        for stub in self.stubs:
+            stub.ids = []
+        self.stubs.clear()
+        self.shared.clear()
+        self.flushed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        self.close()
+
+
+class AsyncStubContextManager:
+    def __init__(self, mock_client: "AsyncWiremockClient", tag: str = "test") -> None:
+        """
+        :param mock_client: The client of the target server.
+        :param tag: The tag name holding the context id.
+        """
+        self.mock_client: "AsyncWiremockClient" = mock_client
+        self.tag: str = tag
+        self.context_id: str = uuid4().hex
+        self.stubs: list[Stub] = []
+
+    async def create_stub(
+        self, stub_request: WireMockRequest, stub_response: WireMockResponse
+    ) -> None:
+        """Creates and registers a stub within the context manager."""
+        stub = Stub().when(stub_request).reply(stub_response)
+        stub.tag(**{self.tag: self.context_id})
+        self.stubs.append(stub)
+        await self.mock_client.create_stub(stub)
+
+    async def __aenter__(self) -> Self:
+        """Return self to allow creation of stubs within the context."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        """Delete the stubs created within the context with a single call by
+        their context tag."""
+        if self.stubs:
+            await self.mock_client.delete_tagged(
+                self.tag, self.context_id, journal=False
+            )
+        for stub in self.stubs:
+            stub.ids = []
         self.stubs.clear()
@@ -0,0 +1,185 @@
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from datetime import datetime, timedelta, timezone
+from time import monotonic, sleep
+from typing import TYPE_CHECKING
+
+from qawiremock.journal import JournalEntry
+
+if TYPE_CHECKING:
+    from qawiremock.client import WiremockClient
+
+DEFAULT_CACHE_SIZE = 10_000
+
+JournalCallback = Callable[[JournalEntry], None]
+
+
+class JournalCursor:
+    """
+    Incremental reader of the request journal.
+
+    Every poll asks the server only for requests logged after the last seen
+    one, so its cost depends on the new traffic, not on the journal size.
+    Entries are deduplicated by id and the most recently logged ones are kept
+    in a bounded cache, evicted oldest first whatever their use.
+    """
+
+    def __init__(
+        self,
+        client: "WiremockClient",
+        matching_stub: str | None = None,
+        unmatched: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        overlap: float = 0.0,
+        skip_existing: bool = False,
+    ) -> None:
+        """
+        :param client: The client of the target server.
+        :param matching_stub: Follow only requests served by this mapping id.
+        :param unmatched: Follow only requests that matched no stub.
+        :param cache_size: The number of entries kept in the cache; the
+            oldest logged entries are evicted first.
+        :param overlap: Seconds re-read before the last seen entry, to catch
+            requests logged out of order by concurrent server threads.
+        :param skip_existing: Ignore the requests already in the journal.
+        """
+        self.client: "WiremockClient" = client
+        self.matching_stub: str | None = matching_stub
+        self.unmatched: bool = unmatched
+        self.cache_size: int = cache_size
+        self.overlap: int = int(overlap * 1000)
+        self.cache: OrderedDict[str, JournalEntry] = OrderedDict()
+        self.callbacks: list[JournalCallback] = []
+        self.last_date: int | None = None
+        # Ids of the entries inside the overlap window, read again next poll.
+        self._recent: dict[str, int] = {}
+        if skip_existing:
+            self.skip()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __contains__(self, entry_id: object) -> bool:
+        return entry_id in self.cache
+
+    def subscribe(self, callback: JournalCallback) -> JournalCallback:
+        """
+        Call a function with every new entry, oldest first.
+
+        :param callback: The function to call.
+        :return: The same function, so that it can be used as a decorator.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def get(self, entry_id: str) -> JournalEntry | None:
+        """
+        Get a cached entry by id.
+
+        :param entry_id: The id of the journal entry.
+        :return: The entry, or None if unknown or evicted. Reading an entry
+            does not delay its eviction.
+        """
+        return self.cache.get(entry_id)
+
+    def entries(self) -> list[JournalEntry]:
+        """
+        Get the cached entries.
+
+        :return: The entries, oldest first.
+        """
+        return list(self.cache.values())
+
+    def since(self) -> datetime | None:
+        """
+        Get the `since` filter of the next poll.
+
+        :return: The moment to read from, or None to read the whole journal.
+        """
+        if self.last_date is None:
+            return None
+        start = self.last_date - self.overlap - 1
+        return datetime.fromtimestamp(0, timezone.utc) + timedelta(milliseconds=start)
+
+    def poll(self) -> list[JournalEntry]:
+        """
+        Fetch the requests logged since the previous poll.
+
+        :return: The new entries, oldest first.
+        """
+        fetched = self._fetch(since=self.since())
+        new = [
+            entry
+            for entry in reversed(fetched)
+            if entry.id not in self._recent and entry.id not in self.cache
+        ]
+        self._advance(fetched)
+        for entry in new:
+            self.cache[entry.id] = entry
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        for callback in self.callbacks:
+            for entry in new:
+                callback(entry)
+        return new
+
+    def _fetch(
+        self, limit: int | None = None, since: datetime | None = None
+    ) -> list[JournalEntry]:
+        return list(
+            self.client.iter_journal(
+                limit=limit,
+                since=since,
+                matching_stub=self.matching_stub,
+                unmatched=self.unmatched,
+            )
+        )
+
+    def _advance(self, fetched: list[JournalEntry]) -> None:
+        dates = [entry.logged_date for entry in fetched if entry.logged_date]
+        if not dates:
+            return
+        self.last_date = max(dates + [self.last_date or 0])
+        start = self.last_date - self.overlap
+        self._recent = {
+            _id: date for _id, date in self._recent.items() if date >= start
+        }
+        for entry in fetched:
+            if entry.logged_date and entry.logged_date >= start:
+                self._recent[entry.id] = entry.logged_date
+
+    def skip(self) -> None:
+        """
+        Move the cursor past the requests currently in the journal.
+        """
+        self._advance(self._fetch(limit=1))
+        if self.last_date is not None:
+            # Other requests may share the date of the latest one.
+            self._advance(self._fetch(since=self.since()))
+
+    def follow(
+        self, interval: float = 0.1, timeout: float | None = None
+    ) -> Generator[JournalEntry, None, None]:
+        """
+        Yield new entries as they are logged, polling the server.
+
+        :param interval: Seconds to wait between polls without new entries.
+        :param timeout: Stop after this many seconds (default: never).
+        :return: An iterator over the new entries, oldest first.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            new = self.poll()
+            yield from new
+            if deadline is not None and monotonic() >= deadline:
+                return
+            if not new:
+                sleep(interval)
+
+    def reset(self) -> None:
+        """
+        Forget the position and the cached entries.
+        """
+        self.cache.clear()
+        self._recent.clear()
+        self.last_date = None
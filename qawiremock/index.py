@@ -0,0 +1,263 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from qawiremock.client import Stub
+
+URL_KEYS = ("url", "urlPath", "urlPattern", "urlPathPattern")
+
+
+class SyncResult(NamedTuple):
+    created: list["Stub"]
+    kept: list["Stub"]
+    deleted: list[str]
+
+
+class IndexedGroup:
+    __slots__ = ("group_id", "ids", "stub", "fingerprint")
+
+    def __init__(
+        self,
+        group_id: str,
+        stub: "Stub | None" = None,
+        fingerprint: str | None = None,
+    ) -> None:
+        self.group_id: str = group_id
+        self.ids: list[str] = []
+        self.stub: "Stub | None" = stub
+        self.fingerprint: str | None = fingerprint
+
+    @property
+    def managed(self) -> bool:
+        """Whether the group was tagged by this library, unlike foreign mappings
+        that form a group of their own id."""
+        return self.group_id not in self.ids
+
+    def get_fingerprint(self) -> str | None:
+        """
+        Get the fingerprint of the group, computing it from its stub if needed.
+
+        :return: The fingerprint, or None for mappings not created by a Stub.
+        """
+        if self.fingerprint is None and self.stub is not None:
+            self.fingerprint = self.stub.fingerprint()
+        return self.fingerprint
+
+
+class MappingIndex:
+    """
+    Client-side index of the server mappings.
+
+    Mappings are indexed by id, by (method, url) and by scenario name, and
+    grouped by the stub that created them. The client keeps it current with
+    its own writes; `load` rebuilds it from a full server listing.
+    """
+
+    def __init__(self, metadata_key: str) -> None:
+        """
+        :param metadata_key: The metadata key holding the client tags.
+        """
+        self.metadata_key: str = metadata_key
+        self.mappings: dict[str, dict[str, Any]] = {}
+        self.groups: dict[str, IndexedGroup] = {}
+        self._group_of: dict[str, str] = {}
+        self._by_request: defaultdict[
+            tuple[str | None, str | None], set[str]
+        ] = defaultdict(set)
+        self._by_scenario: defaultdict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.mappings)
+
+    def __contains__(self, mapping_id: object) -> bool:
+        return mapping_id in self.mappings
+
+    @staticmethod
+    def request_key(mapping: dict[str, Any]) -> tuple[str | None, str | None]:
+        """
+        Get the (method, url) key of a mapping.
+
+        :param mapping: The mapping as a dictionary.
+        :return: The method and the first URL matcher found in the request.
+        """
+        request = mapping.get("request") or {}
+        url = next((request[key] for key in URL_KEYS if key in request), None)
+        return request.get("method"), url
+
+    def tags(self, mapping: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get the client tags of a mapping.
+
+        :param mapping: The mapping as a dictionary.
+        :return: The tags stored under the client metadata key.
+        """
+        return (mapping.get("metadata") or {}).get(self.metadata_key) or {}
+
+    def add(
+        self,
+        mapping: dict[str, Any],
+        stub: "Stub | None" = None,
+        fingerprint: str | None = None,
+    ) -> None:
+        """
+        Add a mapping to the index.
+
+        :param mapping: The mapping as a dictionary, with its id.
+        :param stub: The Stub object the mapping was created from.
+        :param fingerprint: The fingerprint of the stub, if already known.
+        """
+        mapping_id = mapping.get("id") or mapping["uuid"]
+        tags = self.tags(mapping)
+        group_id = stub.group_id if stub else tags.get("stub", mapping_id)
+        group = self.groups.get(group_id)
+        if group is None:
+            group = IndexedGroup(group_id, stub, fingerprint or tags.get("fingerprint"))
+            self.groups[group_id] = group
+        group.ids.append(mapping_id)
+        self.mappings[mapping_id] = mapping
+        self._group_of[mapping_id] = group_id
+        self._by_request[self.request_key(mapping)].add(mapping_id)
+        if mapping.get("scenarioName"):
+            self._by_scenario[mapping["scenarioName"]].add(mapping_id)
+
+    def remove(self, mapping_id: str) -> None:
+        """
+        Remove a mapping from the index.
+
+        :param mapping_id: The id of the mapping.
+        """
+        mapping = self.mappings.pop(mapping_id, None)
+        if mapping is None:
+            return
+        group_id = self._group_of.pop(mapping_id)
+        group = self.groups[group_id]
+        group.ids.remove(mapping_id)
+        if not group.ids:
+            del self.groups[group_id]
+        self._discard(self._by_request, self.request_key(mapping), mapping_id)
+        if mapping.get("scenarioName"):
+            self._discard(self._by_scenario, mapping["scenarioName"], mapping_id)
+
+    @staticmethod
+    def _discard(index: dict[Any, set[str]], key: Any, mapping_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(mapping_id)
+            if not ids:
+                del index[key]
+
+    def remove_group(self, group_id: str) -> list[str]:
+        """
+        Remove all mappings of a stub group from the index.
+
+        :param group_id: The group id.
+        :return: The ids of the removed mappings.
+        """
+        group = self.groups.get(group_id)
+        if group is None:
+            return []
+        ids = list(group.ids)
+        for mapping_id in ids:
+            self.remove(mapping_id)
+        return ids
+
+    def clear(self) -> None:
+        """
+        Remove all mappings from the index.
+        """
+        self.mappings.clear()
+        self.groups.clear()
+        self._group_of.clear()
+        self._by_request.clear()
+        self._by_scenario.clear()
+
+    def load(self, mappings: list[dict[str, Any]]) -> None:
+        """
+        Replace the index content with a full list of server mappings.
+
+        Stubs known before the reload are kept attached to their groups.
+
+        :param mappings: The mappings returned by the server.
+        """
+        stubs = {
+            group_id: group.stub
+            for group_id, group in self.groups.items()
+            if group.stub is not None
+        }
+        self.clear()
+        for mapping in mappings:
+            self.add(mapping)
+        for group_id, stub in stubs.items():
+            if group_id in self.groups:
+                self.groups[group_id].stub = stub
+
+    def tagged(self, tag: str, value: str) -> list[str]:
+        """
+        Find the groups whose mappings carry a client tag.
+
+        :param tag: The tag name.
+        :param value: The tag value.
+        :return: The group ids.
+        """
+        return [
+            group_id
+            for group_id, group in self.groups.items()
+            if self.tags(self.mappings[group.ids[0]]).get(tag) == value
+        ]
+
+    def complete_groups(self, ids: list[str]) -> list[str]:
+        """
+        Find the tagged groups whose mappings are all among the given ones.
+
+        :param ids: Mapping ids.
+        :return: The group ids.
+        """
+        selected = set(ids)
+        group_ids = dict.fromkeys(
+            self._group_of[_id] for _id in ids if _id in self._group_of
+        )
+        return [
+            group_id
+            for group_id in group_ids
+            if self.groups[group_id].managed
+            and selected.issuperset(self.groups[group_id].ids)
+        ]
+
+    def get(self, mapping_id: str) -> dict[str, Any] | None:
+        """
+        Get a mapping by id.
+
+        :param mapping_id: The id of the mapping.
+        :return: The mapping, or None.
+        """
+        return self.mappings.get(mapping_id)
+
+    def find(
+        self, url: str | None = None, method: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Find mappings by request URL and/or method.
+
+        :param url: The URL matcher value of the request.
+        :param method: The HTTP method of the request.
+        :return: A list of matching mappings.
+        """
+        return [
+            self.mappings[mapping_id]
+            for (key_method, key_url), ids in self._by_request.items()
+            if (url is None or key_url == url)
+            and (method is None or key_method == method)
+            for mapping_id in ids
+        ]
+
+    def by_scenario(self, scenario_name: str) -> list[dict[str, Any]]:
+        """
+        Find mappings of a scenario.
+
+        :param scenario_name: The scenario name.
+        :return: A list of the scenario mappings.
+        """
+        return [
+            self.mappings[mapping_id]
+            for mapping_id in self._by_scenario.get(scenario_name, ())
+        ]
@@ -0,0 +1,67 @@
+import json
+from typing import Any, NamedTuple
+
+
+class JournalEntry(NamedTuple):
+    """
+    Compact, validation-free record of a journal entry.
+
+    Only the fields needed for verification and analysis are kept, so large
+    journals can be processed without building the full model tree.
+    """
+
+    id: str
+    logged_date: int | None
+    method: str | None
+    url: str | None
+    status: int | None
+    was_matched: bool
+    stub_id: str | None
+    stub_group: str | None
+    total_time: int | None
+    serve_time: int | None = None
+    process_time: int | None = None
+    added_delay: int | None = None
+
+    @classmethod
+    def from_event(cls, event: dict[str, Any], metadata_key: str) -> "JournalEntry":
+        """
+        Build a record from a decoded journal entry.
+
+        :param event: The journal entry as returned by the server.
+        :param metadata_key: The metadata key holding the client tags.
+        :return: The record.
+        """
+        request = event.get("request") or {}
+        response = event.get("response") or event.get("responseDefinition") or {}
+        mapping = event.get("stubMapping") or {}
+        tags = (mapping.get("metadata") or {}).get(metadata_key) or {}
+        timing = event.get("timing") or {}
+        return cls(
+            event["id"],
+            request.get("loggedDate"),
+            request.get("method"),
+            request.get("url"),
+            response.get("status"),
+            bool(event.get("wasMatched")),
+            mapping.get("id"),
+            tags.get("stub"),
+            timing.get("totalTime"),
+            timing.get("serveTime"),
+            timing.get("processTime"),
+            timing.get("addedDelay"),
+        )
+
+
+def parse_journal(content: bytes, metadata_key: str) -> list[JournalEntry]:
+    """
+    Parse a journal response body into compact records.
+
+    :param content: The raw body of a `/__admin/requests` response.
+    :param metadata_key: The metadata key holding the client tags.
+    :return: The records, in server order (newest first).
+    """
+    return [
+        JournalEntry.from_event(event, metadata_key)
+        for event in json.loads(content)["requests"]
+    ]
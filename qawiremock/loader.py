@@ -0,0 +1,256 @@
+import hashlib
+import json
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+from uuid import NAMESPACE_URL, uuid5
+
+from qawiremock.client import METADATA_KEY, WiremockClient
+from qawiremock.models import MappingFileModel
+
+
+class FileState(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    ids: tuple[str, ...]
+
+
+class ParsedFile(NamedTuple):
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: str
+    content: bytes
+
+
+class LoadResult(NamedTuple):
+    mappings: int
+    files: int
+    removed: list[str]
+
+
+def read_file(path: Path) -> ParsedFile:
+    """
+    Read a file with its modification time and content hash.
+
+    :param path: The file path.
+    :return: The file content and its state.
+    """
+    stat = path.stat()
+    content = path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    return ParsedFile(path, stat.st_mtime_ns, stat.st_size, digest, content)
+
+
+def parse_mappings(content: bytes, source: str) -> list[dict[str, Any]]:
+    """
+    Parse and validate a mapping file.
+
+    A file holds either a single mapping or {"mappings": [...]}. Mappings
+    without an id get a stable one derived from the file path and position.
+
+    :param content: The raw file content.
+    :param source: The file path relative to the mappings directory.
+    :return: The mappings as dictionaries, tagged with their source file.
+        Tags already present under `metadata.qawiremock` are kept.
+    """
+    document = json.loads(content)
+    mappings = document["mappings"] if "mappings" in document else [document]
+    group_id = uuid5(NAMESPACE_URL, source).hex
+    result = []
+    for position, mapping in enumerate(mappings):
+        MappingFileModel(**mapping)
+        _id = mapping.get("id") or mapping.get("uuid")
+        _id = _id or str(uuid5(NAMESPACE_URL, f"{source}#{position}"))
+        metadata = mapping.get("metadata") or {}
+        metadata = {
+            **metadata,
+            METADATA_KEY: {
+                **metadata.get(METADATA_KEY, {}),
+                "stub": group_id,
+                "file": source,
+            },
+        }
+        result.append({**mapping, "id": _id, "uuid": _id, "metadata": metadata})
+    return result
+
+
+class MappingLoader:
+    """
+    Load a WireMock root directory (`mappings` and `__files`) into a server.
+
+    Files are read, hashed and validated in parallel and all mappings are
+    pushed with one import call. `refresh` re-sends only the files whose
+    modification time and content changed, and `watch` refreshes periodically.
+    """
+
+    def __init__(
+        self,
+        client: WiremockClient,
+        root: str | Path,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        :param client: The client of the target server.
+        :param root: The directory holding `mappings` and `__files`.
+        :param executor: Executor used to read files and upload body files.
+            A thread pool is created when omitted, and shut down by `close`.
+        """
+        self.client: WiremockClient = client
+        self.root: Path = Path(root)
+        self.mappings_dir: Path = self.root / "mappings"
+        self.files_dir: Path = self.root / "__files"
+        self._executor: Executor = executor or ThreadPoolExecutor()
+        self._owns_executor: bool = executor is None
+        self._mappings: dict[Path, FileState] = {}
+        self._files: dict[Path, FileState] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut the executor down if it is owned.
+        """
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def load(self) -> LoadResult:
+        """
+        Push every mapping and body file, ignoring the recorded state.
+
+        :return: The number of pushed mappings and files.
+        """
+        self._mappings.clear()
+        self._files.clear()
+        return self.refresh()
+
+    def refresh(self) -> LoadResult:
+        """
+        Push the mappings and body files that changed since the last call.
+
+        Mappings of deleted files, and mappings removed from changed files,
+        are deleted from the server.
+
+        :return: The number of pushed mappings and files, and removed ids.
+        """
+        # The scanned states are kept only once the server is up to date, so
+        # that a failed push is retried by the next refresh.
+        mappings, files = dict(self._mappings), dict(self._files)
+        try:
+            changed_mappings, removed = self._scan_mappings()
+            changed_files = self._scan_files()
+            self._push(changed_mappings, removed, changed_files)
+        except BaseException:
+            self._mappings, self._files = mappings, files
+            raise
+        return LoadResult(len(changed_mappings), len(changed_files), removed)
+
+    def _push(
+        self,
+        mappings: list[dict[str, Any]],
+        removed: list[str],
+        files: list[ParsedFile],
+    ) -> None:
+        uploads = [
+            self._executor.submit(
+                self.client.upload_file,
+                parsed.path.relative_to(self.files_dir).as_posix(),
+                parsed.content,
+            )
+            for parsed in files
+        ]
+        for upload in uploads:
+            upload.result()
+
+        if mappings:
+            self.client.import_mappings(mappings)
+        if removed:
+            self.client.delete_mappings(removed)
+
+    def watch(self, interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        """
+        Refresh until `stop` is set.
+
+        :param interval: Delay between refreshes, in seconds.
+        :param stop: Event that ends the loop; the loop runs forever without it.
+        """
+        stop = stop or threading.Event()
+        while not stop.wait(interval):
+            self.refresh()
+
+    def _read_modified(
+        self, directory: Path, pattern: str, states: dict[Path, FileState]
+    ) -> tuple[list[ParsedFile], list[Path]]:
+        """Read the files whose content may have changed, and list deleted ones."""
+        paths = {
+            path
+            for path in directory.rglob(pattern)
+            if path.is_file() and not path.name.startswith(".")
+        }
+        candidates = []
+        for path in sorted(paths):
+            state = states.get(path)
+            stat = path.stat()
+            current = (stat.st_mtime_ns, stat.st_size)
+            if state and (state.mtime_ns, state.size) == current:
+                continue
+            candidates.append(path)
+
+        modified = []
+        for item in self._executor.map(read_file, candidates):
+            state = states.get(item.path)
+            if state and state.digest == item.digest:
+                states[item.path] = state._replace(
+                    mtime_ns=item.mtime_ns, size=item.size
+                )
+                continue
+            modified.append(item)
+        deleted = [path for path in states if path not in paths]
+        return modified, deleted
+
+    def _scan_mappings(self) -> tuple[list[dict[str, Any]], list[str]]:
+        if not self.mappings_dir.is_dir():
+            return [], []
+        modified, deleted = self._read_modified(
+            self.mappings_dir, "*.json", self._mappings
+        )
+        sources = [
+            item.path.relative_to(self.mappings_dir).as_posix() for item in modified
+        ]
+        documents = self._executor.map(
+            parse_mappings, (item.content for item in modified), sources
+        )
+        changed: list[dict[str, Any]] = []
+        removed: list[str] = []
+        for item, mappings in zip(modified, documents):
+            ids = tuple(mapping["id"] for mapping in mappings)
+            previous = self._mappings.get(item.path)
+            if previous:
+                removed.extend(set(previous.ids) - set(ids))
+            self._mappings[item.path] = FileState(
+                item.mtime_ns, item.size, item.digest, ids
+            )
+            changed.extend(mappings)
+        for path in deleted:
+            removed.extend(self._mappings.pop(path).ids)
+        return changed, removed
+
+    def _scan_files(self) -> list[ParsedFile]:
+        if not self.files_dir.is_dir():
+            return []
+        modified, deleted = self._read_modified(self.files_dir, "*", self._files)
+        for item in modified:
+            self._files[item.path] = FileState(
+                item.mtime_ns, item.size, item.digest, ()
+            )
+        for path in deleted:
+            del self._files[path]
+        return modified
@@ -0,0 +1,347 @@
+import json
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+from requests import Response
+
+from qawiremock.report import Logger
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Bucket upper bounds in seconds, from 0.1 ms to about 52 s.
+HISTOGRAM_BOUNDS: tuple[float, ...] = tuple(0.0001 * 2**i for i in range(20))
+
+
+class CallRecord:
+    """
+    Measurements of one client operation, e.g. a `create_stubs` call.
+
+    Nested operations, such as `create_stub` calling `create_stubs`, are
+    recorded once, under the outermost operation.
+    """
+
+    __slots__ = (
+        "operation",
+        "duration",
+        "http_time",
+        "parse_time",
+        "calls",
+        "request_bytes",
+        "response_bytes",
+        "error",
+    )
+
+    def __init__(self, operation: str) -> None:
+        self.operation: str = operation
+        self.duration: float = 0.0
+        self.http_time: float = 0.0
+        self.parse_time: float = 0.0
+        self.calls: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.error: str | None = None
+
+    def add_call(self, response: Response, elapsed: float, stream: bool) -> None:
+        """
+        Add an HTTP call to the record.
+
+        :param response: The response of the call.
+        :param elapsed: The call duration, in seconds.
+        :param stream: Whether the body is streamed, and so not read yet.
+        """
+        self.calls += 1
+        self.http_time += elapsed
+        body = response.request.body
+        self.request_bytes += len(body) if body else 0
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            self.response_bytes += int(length)
+        elif not stream:
+            self.response_bytes += len(response.content)
+
+
+class MetricsHook(Protocol):
+    def __call__(self, record: CallRecord) -> None:
+        ...
+
+
+class Instrumented(Protocol):
+    hooks: list[MetricsHook]
+
+
+_current: ContextVar[CallRecord | None] = ContextVar(
+    "qawiremock_call_record", default=None
+)
+
+
+def current_record() -> CallRecord | None:
+    """
+    Get the record of the operation running in the current context.
+
+    :return: The record, or None when no hook is registered.
+    """
+    return _current.get()
+
+
+def instrumented(
+    func: Callable[Concatenate[Any, P], R]
+) -> Callable[Concatenate[Any, P], R]:
+    """
+    Record a client method as an operation and pass the record to its hooks.
+
+    Methods of clients without hooks run without any measurement.
+    """
+
+    @wraps(func)
+    def wrapper(self: Instrumented, *args: P.args, **kwargs: P.kwargs) -> R:
+        if not self.hooks or _current.get() is not None:
+            return func(self, *args, **kwargs)
+        record = CallRecord(func.__name__)
+        token = _current.set(record)
+        start = perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        except Exception as error:
+            record.error = type(error).__name__
+            raise
+        finally:
+            record.duration = perf_counter() - start
+            _current.reset(token)
+            for hook in self.hooks:
+                hook(record)
+
+    return wrapper
+
+
+def instrumented_stream(
+    func: Callable[Concatenate[Any, P], Generator[R, None, None]]
+) -> Callable[Concatenate[Any, P], Generator[R, None, None]]:
+    """
+    Record a streaming client method, a generator, as an operation.
+
+    The record is current only while the generator runs, so its duration
+    leaves out the time the consumer spends between items. It is passed to
+    the hooks once the generator is exhausted, fails or is closed.
+    """
+
+    @wraps(func)
+    def wrapper(
+        self: Instrumented, *args: P.args, **kwargs: P.kwargs
+    ) -> Generator[R, None, None]:
+        if not self.hooks or _current.get() is not None:
+            yield from func(self, *args, **kwargs)
+            return
+        record = CallRecord(func.__name__)
+        items = func(self, *args, **kwargs)
+        try:
+            while True:
+                token = _current.set(record)
+                start = perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                except Exception as error:
+                    record.error = type(error).__name__
+                    raise
+                finally:
+                    record.duration += perf_counter() - start
+                    _current.reset(token)
+                yield item
+        finally:
+            token = _current.set(record)
+            start = perf_counter()
+            try:
+                items.close()
+            finally:
+                record.duration += perf_counter() - start
+                _current.reset(token)
+                for hook in self.hooks:
+                    hook(record)
+
+    return wrapper
+
+
+@contextmanager
+def parsing() -> Iterator[None]:
+    """
+    Count the time spent in the block as parse time of the current operation.
+    """
+    record = _current.get()
+    if record is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        record.parse_time += perf_counter() - start
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations, in seconds.
+    """
+
+    __slots__ = ("bounds", "buckets", "count", "total", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = HISTOGRAM_BOUNDS) -> None:
+        """
+        :param bounds: The sorted upper bounds of the buckets.
+        """
+        self.bounds: tuple[float, ...] = bounds
+        self.buckets: list[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add a value to the histogram.
+
+        :param value: The observed duration.
+        """
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.min = value if not self.count else min(self.min, value)
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket holding it.
+
+        :param fraction: The percentile, from 0.0 to 1.0.
+        :return: The estimated value, never above the observed maximum.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class OperationStats:
+    __slots__ = (
+        "duration",
+        "http_time",
+        "parse_time",
+        "calls",
+        "request_bytes",
+        "response_bytes",
+        "errors",
+    )
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.duration: Histogram = Histogram(bounds)
+        self.http_time: float = 0.0
+        self.parse_time: float = 0.0
+        self.calls: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.errors: int = 0
+
+    def add(self, record: CallRecord) -> None:
+        self.duration.observe(record.duration)
+        self.http_time += record.http_time
+        self.parse_time += record.parse_time
+        self.calls += record.calls
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        self.errors += record.error is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.duration.count,
+            "duration": self.duration.to_dict(),
+            "http_time": self.http_time,
+            "parse_time": self.parse_time,
+            "http_calls": self.calls,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "errors": self.errors,
+        }
+
+
+class MetricsCollector:
+    """
+    In-memory hook aggregating the records of every operation.
+
+    Register it with `WiremockClient(hooks=[collector])`; one collector may be
+    shared by several clients and threads.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = HISTOGRAM_BOUNDS) -> None:
+        """
+        :param bounds: The histogram bucket upper bounds, in seconds.
+        """
+        self.bounds: tuple[float, ...] = bounds
+        self.operations: dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: CallRecord) -> None:
+        with self._lock:
+            stats = self.operations.get(record.operation)
+            if stats is None:
+                stats = self.operations[record.operation] = OperationStats(self.bounds)
+            stats.add(record)
+
+    def reset(self) -> None:
+        """
+        Drop all collected measurements.
+        """
+        with self._lock:
+            self.operations.clear()
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize the measurements per operation; durations are in seconds.
+
+        :return: The summary as a dictionary.
+        """
+        with self._lock:
+            return {
+                operation: stats.to_dict()
+                for operation, stats in sorted(self.operations.items())
+            }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """
+        Export the summary as JSON.
+
+        :param indent: The JSON indentation.
+        :return: The JSON document.
+        """
+        return json.dumps(self.summary(), indent=indent)
+
+    def attach(self, name: str = "Wiremock client metrics") -> None:
+        """
+        Attach the summary to the report, e.g. once at the end of a session.
+
+        :param name: The attachment name.
+        """
+        Logger.attach_summary(name, self.summary)
@@ -1,11 +1,29 @@
-from typing import Any
-
-from pydantic import BaseModel, Extra, Field, field_validator
+import math
+from enum import StrEnum
+from typing import Any, Literal
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Extra,
+    Field,
+    field_validator,
+    model_validator,
+)
 from pydantic_core.core_schema import ValidationInfo
-from wiremock.resources.mappings import CommonHeaders
+
+CONTENT_TYPE = "Content-Type"
+# Standard normal quantile of the 99th percentile.
+Z_99 = 2.3263478740408408
+
+
+class DeferredModel(BaseModel):
+    """Base model whose validation schema is built on first use, not on import."""
+
+    model_config = ConfigDict(defer_build=True)
 
 
-class Header(BaseModel):
+class Header(DeferredModel):
     host: str | None = None
     content_type: str | None = Field(None, serialization_alias="Content-Type")
     accept: str | None = None
@@ -20,7 +38,7 @@ class Header(BaseModel):
         extra = Extra.allow
 
 
-class StubMappingRequestHistory(BaseModel):
+class StubMappingRequestHistory(DeferredModel):
     url: str | None = None
     absolute_url: str | None = Field(None, alias="absoluteUrl")
     method: str | None = None
@@ -36,7 +54,7 @@ class StubMappingRequestHistory(BaseModel):
     form_params: dict[str, Any] | None = Field(None, alias="formParams")
 
 
-class ResponseDefinition(BaseModel):
+class ResponseDefinition(DeferredModel):
     status: int | None
     body: str | None = None
     headers: Header | None = None
@@ -46,18 +64,75 @@ class ResponseDefinition(BaseModel):
         extra = Extra.allow
 
 
-class WireMockResponse(BaseModel):
+class Fault(StrEnum):
+    CONNECTION_RESET_BY_PEER = "CONNECTION_RESET_BY_PEER"
+    EMPTY_RESPONSE = "EMPTY_RESPONSE"
+    MALFORMED_RESPONSE_CHUNK = "MALFORMED_RESPONSE_CHUNK"
+    RANDOM_DATA_THEN_CLOSE = "RANDOM_DATA_THEN_CLOSE"
+
+
+class LogNormalDelay(DeferredModel):
+    """Random delay with a long tail, in milliseconds."""
+
+    type: Literal["lognormal"] = "lognormal"
+    median: int
+    sigma: float
+
+    @classmethod
+    def from_percentiles(cls, median: int, p99: int) -> "LogNormalDelay":
+        """
+        Build a delay reproducing an observed latency profile.
+
+        :param median: The median latency, in milliseconds.
+        :param p99: The 99th percentile latency, in milliseconds.
+        :return: The delay distribution.
+        """
+        if not 0 < median <= p99:
+            raise ValueError("Expected 0 < median <= p99")
+        return cls(median=median, sigma=math.log(p99 / median) / Z_99)
+
+
+class UniformDelay(DeferredModel):
+    """Random delay between two bounds, in milliseconds."""
+
+    type: Literal["uniform"] = "uniform"
+    lower: int
+    upper: int
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "UniformDelay":
+        if not 0 <= self.lower <= self.upper:
+            raise ValueError("Expected 0 <= lower <= upper")
+        return self
+
+
+class ChunkedDribbleDelay(DeferredModel):
+    """Body sent in chunks spread over a duration, in milliseconds."""
+
+    number_of_chunks: int = Field(serialization_alias="numberOfChunks")
+    total_duration: int = Field(serialization_alias="totalDuration")
+
+
+class WireMockResponse(DeferredModel):
     status: int | None
-    headers: dict[str, Any] = {CommonHeaders.CONTENT_TYPE: "application/json"}
+    headers: dict[str, Any] = {CONTENT_TYPE: "application/json"}
     body_as_base64: str | None = Field(None, serialization_alias="bodyAsBase64")
     json_body: dict[str, Any] | str | None = Field(None, serialization_alias="jsonBody")
+    body_file_name: str | None = Field(None, serialization_alias="bodyFileName")
     transformers: list[str] | None = ["response-template"]
     fixed_delay_milliseconds: int | None = Field(
         0, serialization_alias="fixedDelayMilliseconds"
     )
+    delay_distribution: LogNormalDelay | UniformDelay | None = Field(
+        None, serialization_alias="delayDistribution", discriminator="type"
+    )
+    chunked_dribble_delay: ChunkedDribbleDelay | None = Field(
+        None, serialization_alias="chunkedDribbleDelay"
+    )
+    fault: Fault | None = None
 
 
-class StubMapping(BaseModel):
+class StubMapping(DeferredModel):
     id: str | None
     request: StubMappingRequestHistory | None
     response: WireMockResponse | None
@@ -65,9 +140,10 @@ class StubMapping(BaseModel):
     scenario_name: str | None = Field(None, alias="scenarioName")
     required_scenario_state: str | None = Field(None, alias="requiredScenarioState")
     new_scenario_state: str | None = Field(None, alias="newScenarioState")
+    metadata: dict[str, Any] | None = None
 
 
-class TimingRequestHistory(BaseModel):
+class TimingRequestHistory(DeferredModel):
     add_delay: int = Field(alias="addedDelay")
     process_time: int = Field(alias="processTime")
     response_send_time: int = Field(alias="responseSendTime")
@@ -75,7 +151,7 @@ class TimingRequestHistory(BaseModel):
     total_time: int = Field(alias="totalTime")
 
 
-class RequestsHistoryModel(BaseModel):
+class RequestsHistoryModel(DeferredModel):
     id: str
     request: StubMappingRequestHistory
     response_definition: ResponseDefinition = Field(alias="responseDefinition")
@@ -86,22 +162,51 @@ class RequestsHistoryModel(BaseModel):
     stub_mapping: StubMapping = Field(alias="stubMapping")
 
 
-class Meta(BaseModel):
+class Meta(DeferredModel):
     total: int | None
 
 
-class WiremockRequestsHistoryModel(BaseModel):
+class WiremockRequestsHistoryModel(DeferredModel):
     requests: list[RequestsHistoryModel]
     meta: Meta
     request_journal_disabled: bool = Field(alias="requestJournalDisabled")
 
 
-class RequestMappingModel(BaseModel):
+class ScenarioStateModel(DeferredModel):
+    id: str | None = None
+    name: str
+    state: str
+    possible_states: list[str] | None = Field(None, alias="possibleStates")
+
+
+class ScenariosModel(DeferredModel):
+    scenarios: list[ScenarioStateModel]
+
+
+class MappingFileModel(DeferredModel):
+    id: str | None = None
+    uuid: str | None = None
+    request: dict[str, Any]
+    response: ResponseDefinition
+
+    class Config:
+        extra = Extra.allow
+
+
+class LoggedRequestsModel(DeferredModel):
+    requests: list[StubMappingRequestHistory]
+
+
+class RequestsCountModel(DeferredModel):
+    count: int
+
+
+class RequestMappingModel(DeferredModel):
     meta: Meta
     mappings: list[StubMapping]
 
 
-class Matcher(BaseModel):
+class Matcher(DeferredModel):
     contains: str | None = None
     equal_to: str | None = Field(None, serialization_alias="equalTo")
     matches_regex: str | None = Field(None, serialization_alias="matches")
@@ -119,7 +224,7 @@ class Matcher(BaseModel):
     absent: bool | None = Field(None, serialization_alias="absent")
 
 
-class WireMockRequest(BaseModel):
+class WireMockRequest(DeferredModel):
     url: str | None = None
     url_path_pattern: str | None = Field(None, serialization_alias="urlPathPattern")
     method: str | None = None
@@ -148,12 +253,12 @@ class WireMockRequest(BaseModel):
         return url
 
 
-class MappingModel(BaseModel):
+class MappingModel(DeferredModel):
     request: WireMockRequest
     response: WireMockResponse
 
 
-class LogStubDataModel(BaseModel):
+class LogStubDataModel(DeferredModel):
     url: str | None = None
     method: str | None = None
     status_code: int | None = None
@@ -165,6 +270,9 @@ class LogStubDataModel(BaseModel):
     delay: int | None = None
     stub_status: str | None = None
     fixed_delay_milliseconds: int | None = None
+    delay_distribution: LogNormalDelay | UniformDelay | None = None
+    chunked_dribble_delay: ChunkedDribbleDelay | None = None
+    fault: Fault | None = None
     transformers: list[Any] | None = None
     body_patterns: list[Matcher] | None = None
     body: dict[str, Any] | str | None = None
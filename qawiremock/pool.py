@@ -0,0 +1,143 @@
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
+from typing import Any, Self, TypeVar
+
+from requests import Response, Session
+
+from qawiremock.client import WiremockClient
+from qawiremock.registry import StubRegistry
+from qawiremock.transport import DEFAULT_POOL_SIZE, create_session
+
+T = TypeVar("T")
+
+XDIST_WORKER_ENV = "PYTEST_XDIST_WORKER"
+
+
+class WiremockPool:
+    """
+    A set of WireMock instances sharing the load of parallel test workers.
+
+    Each pytest-xdist worker (or any routing key) is pinned to one instance,
+    and attribute access is delegated to that instance's client, so the pool
+    can be used in place of a WiremockClient. Broadcast operations run on all
+    instances in parallel.
+    """
+
+    def __init__(
+        self,
+        instances: list[tuple[str, int]],
+        timeout: int = WiremockClient.HTTP_TIMEOUT,
+        session: Session | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        registry_factory: Callable[[], StubRegistry] | None = None,
+        **client_kwargs: Any,
+    ) -> None:
+        """
+        :param instances: The (host, port) pairs of the WireMock instances.
+        :param timeout: HTTP timeout in seconds.
+        :param session: Shared session to use instead of creating a new one.
+        :param pool_size: Maximum number of pooled connections per instance.
+        :param registry_factory: Builds the StubRegistry of each instance,
+            e.g. `StubRegistry` or `lambda: StubRegistry(max_idle=10)`.
+        :param client_kwargs: Extra arguments for every WiremockClient. Metrics
+            hooks are shared by all clients; a registry cannot be, since it
+            tracks the mappings of a single server.
+        """
+        if not instances:
+            raise ValueError("At least one WireMock instance must be specified")
+        if client_kwargs.pop("registry", None) is not None:
+            raise ValueError(
+                "A StubRegistry tracks a single instance, use registry_factory"
+            )
+        self._owns_session: bool = session is None
+        self.session: Session = session or create_session(
+            pool_size=pool_size, host_pools=len(instances)
+        )
+        self.clients: list[WiremockClient] = [
+            WiremockClient(
+                host,
+                port,
+                timeout,
+                session=self.session,
+                registry=registry_factory() if registry_factory else None,
+                **client_kwargs,
+            )
+            for host, port in instances
+        ]
+        self._executor = ThreadPoolExecutor(max_workers=len(self.clients))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None
+    ) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name == "clients":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def close(self) -> None:
+        """
+        Stop the broadcast workers and close the session if it is owned.
+        """
+        self._executor.shutdown()
+        if self._owns_session:
+            self.session.close()
+
+    @staticmethod
+    def worker_index() -> int:
+        """
+        Get the index of the current pytest-xdist worker.
+
+        :return: N for worker "gwN", 0 when not running under xdist.
+        """
+        worker = environ.get(XDIST_WORKER_ENV, "")
+        digits = "".join(char for char in worker if char.isdigit())
+        return int(digits) if digits else 0
+
+    def client_for(self, key: int | str | None = None) -> WiremockClient:
+        """
+        Get the client of the instance assigned to a routing key.
+
+        :param key: A worker number, a string such as a test node id, or None
+            for the current xdist worker.
+        :return: The WiremockClient of the assigned instance.
+        """
+        if key is None:
+            key = self.worker_index()
+        if isinstance(key, str):
+            key = zlib.crc32(key.encode())
+        return self.clients[key % len(self.clients)]
+
+    @property
+    def client(self) -> WiremockClient:
+        """The client of the instance assigned to the current worker."""
+        return self.client_for()
+
+    def broadcast(self, operation: Callable[[WiremockClient], T]) -> list[T]:
+        """
+        Run an operation on every instance in parallel.
+
+        :param operation: A function called with each client.
+        :return: The results, in the order of the instances.
+        """
+        return list(self._executor.map(operation, self.clients))
+
+    def delete_all_stubs(self) -> list[Response]:
+        """
+        Delete all stubs from every instance.
+
+        :return: The HTTP response objects.
+        """
+        return self.broadcast(WiremockClient.delete_all_stubs)
+
+    def clear_history(self) -> None:
+        """
+        Delete the request history of every instance.
+        """
+        self.broadcast(WiremockClient.clear_history)
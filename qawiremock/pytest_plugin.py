@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from qawiremock.client import WiremockClient
+    from qawiremock.context_manager import StubBatch
+
+BATCH_FIXTURES = ("wiremock_session_stubs", "wiremock_stubs")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("qawiremock")
+    group.addoption("--wiremock-host", help="Host of the WireMock server.")
+    group.addoption("--wiremock-port", type=int, help="Port of the WireMock server.")
+    parser.addini("wiremock_host", "Host of the WireMock server.")
+    parser.addini("wiremock_port", "Port of the WireMock server.", default="80")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item: pytest.Item) -> None:
+    """Create the stubs queued during setup right before the test body runs."""
+    funcargs = getattr(item, "funcargs", {})
+    for name in BATCH_FIXTURES:
+        batch = funcargs.get(name)
+        if batch is not None:
+            batch.flush()
+
+
+@pytest.fixture(scope="session")
+def wiremock_client(pytestconfig: pytest.Config) -> Iterator["WiremockClient"]:
+    """
+    Client of the WireMock server given by --wiremock-host/--wiremock-port or
+    the wiremock_host/wiremock_port ini options. Override it in a conftest to
+    configure the client differently, e.g. with a WiremockPool.
+    """
+    from qawiremock.client import WiremockClient
+
+    host = pytestconfig.getoption("wiremock_host") or pytestconfig.getini(
+        "wiremock_host"
+    )
+    if not host:
+        pytest.skip("WireMock host is not configured, use --wiremock-host")
+    port = pytestconfig.getoption("wiremock_port") or int(
+        pytestconfig.getini("wiremock_port")
+    )
+    with WiremockClient(host, port) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def wiremock_session_stubs(
+    wiremock_client: "WiremockClient",
+) -> Iterator["StubBatch"]:
+    """
+    Stubs shared by all tests of the session.
+
+    They are created once, with the first test using this fixture, and
+    deleted at the end of the session.
+    """
+    from qawiremock.context_manager import StubBatch
+
+    with StubBatch(wiremock_client, tag="session") as batch:
+        yield batch
+
+
+@pytest.fixture
+def wiremock_stubs(wiremock_client: "WiremockClient") -> Iterator["StubBatch"]:
+    """
+    Stubs of the current test.
+
+    Stubs added during setup are created with one call before the test body
+    runs; those added in the test body are created immediately. On teardown,
+    the stubs and their journal entries are deleted by their test tag.
+    """
+    from qawiremock.context_manager import StubBatch
+
+    with StubBatch(wiremock_client, tag="test") as batch:
+        yield batch
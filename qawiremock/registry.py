@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qawiremock.client import Stub
+
+
+class RegistryEntry:
+    __slots__ = ("ids", "group_id", "refs")
+
+    def __init__(self, ids: list[str], group_id: str) -> None:
+        self.ids: list[str] = ids
+        self.group_id: str = group_id
+        self.refs: int = 0
+
+
+class StubRegistry:
+    """
+    Content-addressed registry of stubs created on the server.
+
+    Stubs with the same fingerprint share one server-side mapping, counted by
+    reference. A mapping is deleted when its last user releases it, unless it
+    is kept as one of the `max_idle` most recently used idle mappings.
+    Only stateless stubs (no scenario, times=0) are shared.
+    """
+
+    def __init__(self, max_idle: int = 0) -> None:
+        """
+        :param max_idle: Number of released mappings kept on the server for
+            reuse, the least recently used are deleted first (default: 0).
+        """
+        self.max_idle: int = max_idle
+        self._entries: OrderedDict[str, RegistryEntry] = OrderedDict()
+        self._groups: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return fingerprint in self._entries
+
+    @staticmethod
+    def is_shareable(stub: "Stub") -> bool:
+        """
+        Check whether a stub may share its mapping with other stubs.
+
+        :param stub: The Stub object to check.
+        :return: True for stubs without scenario state.
+        """
+        return stub.times == 0 and not stub.scenario_name
+
+    def acquire(self, stub: "Stub", fingerprint: str) -> bool:
+        """
+        Attach a stub to an already registered mapping.
+
+        :param stub: The Stub object to attach.
+        :param fingerprint: The fingerprint of the stub.
+        :return: True if the mapping exists and the stub now uses it.
+        """
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return False
+        entry.refs += 1
+        self._entries.move_to_end(fingerprint)
+        stub.group_id = entry.group_id
+        stub.ids = list(entry.ids)
+        return True
+
+    def users(self, stub: "Stub") -> int:
+        """
+        Count the stubs currently using the mapping of a stub.
+
+        :param stub: The Stub object to check.
+        :return: The reference count, 0 for stubs not managed by the registry.
+        """
+        fingerprint = self._groups.get(stub.group_id)
+        if fingerprint is None or fingerprint not in self._entries:
+            return 0
+        return self._entries[fingerprint].refs
+
+    def register(self, stub: "Stub", fingerprint: str, ids: list[str]) -> None:
+        """
+        Register a newly created mapping used by a stub.
+
+        :param stub: The Stub object that created the mapping.
+        :param fingerprint: The fingerprint of the stub.
+        :param ids: The ids of the created mappings.
+        """
+        entry = RegistryEntry(list(ids), stub.group_id)
+        entry.refs = 1
+        self._entries[fingerprint] = entry
+        self._groups[stub.group_id] = fingerprint
+
+    def release(self, stub: "Stub") -> list[str]:
+        """
+        Release a stub and collect the mappings that are no longer needed.
+
+        :param stub: The Stub object to release.
+        :return: Mapping ids to delete from the server. For stubs that are not
+            managed by the registry, these are the stub's own ids.
+        """
+        fingerprint = self._groups.get(stub.group_id)
+        if fingerprint is None:
+            return stub.ids
+        if not stub.ids:
+            return []
+        stub.ids = []
+        entry = self._entries[fingerprint]
+        entry.refs -= 1
+        if entry.refs > 0:
+            return []
+        return self._evict()
+
+    def _evict(self) -> list[str]:
+        idle = [fp for fp, entry in self._entries.items() if entry.refs <= 0]
+        ids: list[str] = []
+        for fingerprint in idle[: max(0, len(idle) - self.max_idle)]:
+            entry = self._entries.pop(fingerprint)
+            self._groups.pop(entry.group_id, None)
+            ids.extend(entry.ids)
+        return ids
+
+    def forget(self, group_id: str) -> None:
+        """
+        Drop the entry of a group whose mappings were deleted on the server.
+
+        :param group_id: The group id.
+        """
+        fingerprint = self._groups.pop(group_id, None)
+        if fingerprint is not None:
+            self._entries.pop(fingerprint, None)
+
+    def clear(self) -> None:
+        """
+        Forget all entries, e.g. after all stubs were deleted on the server.
+        """
+        self._entries.clear()
+        self._groups.clear()
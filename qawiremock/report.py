@@ -1,18 +1,177 @@
 import json
-from typing import Any
+import random
+import warnings
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from os import environ
+from typing import Any, TypeVar
 from urllib.parse import parse_qsl, urlsplit
 
-import allure
 from requests import Response
 
 from qawiremock.models import LogStubDataModel, WireMockRequest, WireMockResponse
 
+T = TypeVar("T")
+
+
+class AttachmentType(StrEnum):
+    TEXT = "TEXT"
+    JSON = "JSON"
+    HTML = "HTML"
+
+
+class ReportLevel(StrEnum):
+    OFF = "off"
+    SUMMARY = "summary"
+    FULL = "full"
+
+
+Attachment = tuple[Callable[[], str], str, AttachmentType]
+
+# Buffer of the current `Logger.buffered` block, per thread and asyncio task.
+_buffer: ContextVar[list[Attachment] | None] = ContextVar(
+    "qawiremock_report_buffer", default=None
+)
+
+
+def env_setting(name: str, parse: Callable[[str], T], default: T) -> T:
+    """
+    Read a reporting setting from the environment.
+
+    An invalid value falls back to the default with a warning, so that a typo
+    does not break the package import.
+
+    :param name: The environment variable.
+    :param parse: Converts the raw value.
+    :param default: The value used when the variable is unset or invalid.
+    :return: The setting.
+    """
+    raw = environ.get(name)
+    if not raw:
+        return default
+    try:
+        return parse(raw)
+    except ValueError:
+        warnings.warn(
+            f"Invalid {name}={raw!r}, using {default}", RuntimeWarning, stacklevel=2
+        )
+        return default
+
 
 class Logger:
+    report_level: ReportLevel = env_setting(
+        "QAWIREMOCK_REPORT_LEVEL", ReportLevel, ReportLevel.FULL
+    )
+    max_attachment_size: int | None = env_setting(
+        "QAWIREMOCK_MAX_ATTACHMENT_SIZE", int, None
+    )
+    sample_rate: float = env_setting("QAWIREMOCK_REPORT_SAMPLE_RATE", float, 1.0)
+
+    @classmethod
+    def configure(
+        cls,
+        level: ReportLevel | None = None,
+        max_attachment_size: int | None = None,
+        sample_rate: float | None = None,
+    ) -> None:
+        """
+        Configure reporting for all clients and stubs.
+
+        :param level: OFF disables reporting, SUMMARY attaches one line per call,
+            FULL attaches the whole payload.
+        :param max_attachment_size: Truncate attachments to this many characters,
+            0 removes the limit.
+        :param sample_rate: Share of the calls to report, from 0.0 to 1.0.
+        """
+        if level is not None:
+            Logger.report_level = ReportLevel(level)
+        if max_attachment_size is not None:
+            Logger.max_attachment_size = max_attachment_size
+        if sample_rate is not None:
+            Logger.sample_rate = sample_rate
+
+    @classmethod
+    @contextmanager
+    def buffered(cls) -> Iterator[None]:
+        """
+        Collect attachments and write them all at once when the block exits.
+
+        Payloads are rendered only on flush, keeping the formatting cost out of
+        the admin calls. Nested blocks are flushed by the outermost one. The
+        buffer belongs to the current thread or asyncio task, so concurrent
+        tests do not flush or drop each other's attachments.
+        """
+        if _buffer.get() is not None:
+            yield
+            return
+        token = _buffer.set([])
+        try:
+            yield
+        finally:
+            cls.flush()
+            _buffer.reset(token)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write the attachments buffered in the current context to the report."""
+        pending = _buffer.get()
+        if pending is None:
+            return
+        items = list(pending)
+        pending.clear()
+        for render, name, attachment_type in items:
+            cls._write(render(), name, attachment_type)
+
     @classmethod
     def pretty_json(cls, value: Any) -> str:
         return json.dumps(value, ensure_ascii=True, indent=4, sort_keys=True)
 
+    @classmethod
+    def _should_report(cls) -> bool:
+        if cls.report_level == ReportLevel.OFF:
+            return False
+        return cls.sample_rate >= 1 or random.random() < cls.sample_rate
+
+    @classmethod
+    def _truncate(cls, content: str) -> tuple[str, bool]:
+        limit = cls.max_attachment_size
+        if not limit or len(content) <= limit:
+            return content, False
+        return f"{content[:limit]}\n... truncated {len(content) - limit} chars", True
+
+    @classmethod
+    def _write(cls, content: str, name: str, attachment_type: AttachmentType) -> None:
+        # allure is imported on the first attachment, keeping it out of the
+        # package import time and out of runs with reporting off.
+        import allure
+
+        content, truncated = cls._truncate(content)
+        if truncated:
+            attachment_type = AttachmentType.TEXT
+        allure.attach(
+            content, name, getattr(allure.attachment_type, attachment_type.value)
+        )
+
+    @classmethod
+    def _attach(
+        cls, render: Callable[[], str], name: str, attachment_type: AttachmentType
+    ) -> None:
+        """Attach lazily rendered content, or buffer it until the next flush."""
+        pending = _buffer.get()
+        if pending is not None:
+            pending.append((render, name, attachment_type))
+        else:
+            cls._write(render(), name, attachment_type)
+
+    @classmethod
+    def attach_summary(cls, name: str, summary: Callable[[], Any]) -> None:
+        """Attach a lazily built JSON summary, unless reporting is off."""
+        if cls.report_level == ReportLevel.OFF:
+            return
+        cls._attach(lambda: cls.pretty_json(summary()), name, AttachmentType.JSON)
+
     @staticmethod
     def _parse_response_body(response: Response) -> dict[str, Any] | None:
         """Parse the JSON response body,
@@ -41,65 +200,119 @@ class Logger:
         return dict(parse_qsl(urlsplit(url).query))
 
     @classmethod
-    def _attach_json_response(cls, dump_response: LogStubDataModel) -> None:
-        """Attach JSON response to the report."""
-        prepared_data: str = cls.pretty_json(dump_response.model_dump())
-        attachment_name = f"HTTP Response - {prepared_data}"
-        allure.attach(prepared_data, attachment_name, allure.attachment_type.JSON)
+    def _attach_json_response(
+        cls, name: str, dump_response: Callable[[], LogStubDataModel]
+    ) -> None:
+        """Attach JSON response to the report, or its summary line."""
+        if cls.report_level == ReportLevel.SUMMARY:
+            cls._attach(lambda: name, name, AttachmentType.TEXT)
+            return
+        cls._attach(
+            lambda: cls.pretty_json(dump_response().model_dump()),
+            name,
+            AttachmentType.JSON,
+        )
 
-    @staticmethod
-    def _attach_html_response(response: Response) -> None:
+    @classmethod
+    def _attach_html_response(cls, response: Response) -> None:
         """Attach HTML response to the report."""
         attachment_name = (
             f"Response (as HTML) - {response.status_code} {response.request.path_url}"
         )
-        allure.attach(response.text, attachment_name, allure.attachment_type.HTML)
+        if cls.report_level == ReportLevel.SUMMARY:
+            cls._attach(lambda: attachment_name, attachment_name, AttachmentType.TEXT)
+            return
+        cls._attach(lambda: response.text, attachment_name, AttachmentType.HTML)
 
     @classmethod
     def attach_response(cls, response: Response) -> None:
         """Process and attach the response to the report."""
+        if not cls._should_report():
+            return
         content_type: str | None = response.headers.get("Content-Type")
 
         if content_type and content_type.startswith("application/json"):
-            body = cls._parse_response_body(response)
-            cookies = cls._parse_cookies(response)
-            query_parameters = cls._parse_query_parameters(response.request.url)
-
-            dump_response = LogStubDataModel(
+            cls.attach_json_exchange(
                 url=response.request.url,
                 method=response.request.method,
                 status_code=response.status_code,
                 headers=dict(response.headers),
-                json_body=body,
-                cookies=cookies,
-                parameters=query_parameters,
+                body=lambda: cls._parse_response_body(response),
+                cookies=cls._parse_cookies(response),
+                sampled=True,
             )
 
-            cls._attach_json_response(dump_response)
-
         if content_type and content_type.startswith("text/html"):
             cls._attach_html_response(response)
 
+    @classmethod
+    def attach_json_exchange(
+        cls,
+        url: str | None,
+        method: str | None,
+        status_code: int,
+        headers: dict[str, str],
+        body: Any,
+        cookies: dict[str, str] | None = None,
+        sampled: bool = False,
+    ) -> None:
+        """Attach an already decoded JSON response to the report.
+
+        `body` may be a callable, so that decoding happens only when needed.
+        """
+        if not sampled and not cls._should_report():
+            return
+
+        def dump() -> LogStubDataModel:
+            json_body = body() if callable(body) else body
+            return LogStubDataModel(
+                url=url,
+                method=method,
+                status_code=status_code,
+                headers=headers,
+                json_body=json_body if isinstance(json_body, dict) else None,
+                cookies=cookies or {},
+                parameters=cls._parse_query_parameters(url),
+            )
+
+        path = urlsplit(url).path if url else ""
+        name = f"HTTP Response - {status_code} {method} {path}"
+        cls._attach_json_response(name, dump)
+
     @classmethod
     def attach_stub_response(cls, response: WireMockResponse) -> None:
-        dump_response = LogStubDataModel(
-            status_code=response.status,
-            headers=dict(response.headers),
-            json_body=response.json_body,
-            fixed_delay_milliseconds=response.fixed_delay_milliseconds,
-            transformers=response.transformers,
-        )
-        cls._attach_json_response(dump_response)
+        if not cls._should_report():
+            return
+
+        def dump() -> LogStubDataModel:
+            return LogStubDataModel(
+                status_code=response.status,
+                headers=dict(response.headers),
+                json_body=response.json_body,
+                fixed_delay_milliseconds=response.fixed_delay_milliseconds,
+                delay_distribution=response.delay_distribution,
+                chunked_dribble_delay=response.chunked_dribble_delay,
+                fault=response.fault,
+                transformers=response.transformers,
+            )
+
+        cls._attach_json_response(f"Stub response - {response.status}", dump)
 
     @classmethod
     def attach_stub_request(cls, request: WireMockRequest) -> None:
-        dump_response = LogStubDataModel(
-            url=request.url,
-            method=request.method,
-            headers=dict(request.headers),
-            cookies=dict(request.cookies),
-            parameters=request.parameters,
-            body_patterns=request.body_patterns,
-            json_body=None,
-        )
-        cls._attach_json_response(dump_response)
+        if not cls._should_report():
+            return
+
+        def dump() -> LogStubDataModel:
+            return LogStubDataModel(
+                url=request.url,
+                method=request.method,
+                headers=dict(request.headers),
+                cookies=dict(request.cookies),
+                parameters=request.parameters,
+                body_patterns=request.body_patterns,
+                json_body=None,
+            )
+
+        url = request.url or request.url_path_pattern
+        cls._attach_json_response(f"Stub request - {request.method} {url}", dump)
@@ -0,0 +1,114 @@
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]}" + _WHITESPACE
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """A text window over a stream of UTF-8 chunks.
+
+    Only the unparsed tail of the stream is kept, so memory is bounded by
+    the largest single JSON value plus one chunk.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk, returning False at the end of the stream."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            decoded = self._utf8.decode(b"", final=True)
+        else:
+            decoded = self._utf8.decode(chunk)
+        self.text = self.text[self.pos :] + decoded
+        self.pos = 0
+        return not self.eof
+
+    def peek(self) -> str | None:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`."""
+        char = self.peek()
+        if char is None or char not in chars:
+            raise ValueError(f"Expected one of {chars!r}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number is complete only once followed by a delimiter, as a
+            # chunk may end anywhere inside it, e.g. right after "-12500.".
+            if self.eof or not self._is_number(value) or self._delimited(end):
+                self.pos = end
+                return value
+            self.fill()
+
+    def _delimited(self, end: int) -> bool:
+        return end < len(self.text) and self.text[end] in _DELIMITERS
+
+    @staticmethod
+    def _is_number(value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Lazily decode the items of an array stored under `key` of a JSON object.
+
+    Other top-level values are decoded and dropped. Items are yielded as soon
+    as they are complete, so a consumer may stop reading at any point.
+
+    :param chunks: The raw response body, as an iterable of byte chunks.
+    :param key: The top-level key holding the array.
+    :return: An iterator over the decoded array items.
+    """
+    buffer = _Buffer(chunks)
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        return
+    while True:
+        name = buffer.value()
+        buffer.expect(":")
+        if name == key and buffer.peek() == "[":
+            buffer.expect("[")
+            if buffer.peek() == "]":
+                buffer.expect("]")
+            else:
+                while True:
+                    yield buffer.value()
+                    if buffer.expect(",]") == "]":
+                        break
+        else:
+            buffer.value()
+        if buffer.expect(",}") == "}":
+            return
@@ -0,0 +1,50 @@
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    keep_alive: bool = True,
+    retries: int = 0,
+    backoff_factor: float = 0.0,
+    retry_statuses: tuple[int, ...] = DEFAULT_RETRY_STATUSES,
+    gzip: bool = True,
+    host_pools: int | None = None,
+) -> Session:
+    """
+    Create a pooled HTTP session for the Wiremock admin API.
+
+    One session can be shared between several clients, so that all of them
+    reuse the same keep-alive connections.
+
+    :param pool_size: Maximum number of connections kept open per host.
+    :param keep_alive: Keep connections open between calls (default: True).
+    :param retries: Number of retries for idempotent calls (default: 0).
+    :param backoff_factor: Backoff factor between retries, in seconds.
+    :param retry_statuses: HTTP statuses that trigger a retry.
+    :param gzip: Ask the server for gzip-compressed responses (default: True).
+    :param host_pools: Number of hosts to keep connection pools for
+        (default: pool_size).
+    :return: Configured Session object.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=host_pools or pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    return session
@@ -8,6 +8,8 @@ here: Path = Path(__file__).parent.absolute()
 readme_filename = "HISTORY.md"
 requirements_file = "requirements/requirements.txt"
 requirements_file_quality = "requirements/requirements.quality.txt"
+requirements_file_async = "requirements/requirements.async.txt"
+requirements_file_analytics = "requirements/requirements.analytics.txt"
 
 FILE_NAME = "VERSION"
 version = None
@@ -60,10 +62,14 @@ setup(
     url=URL,
     author="Game Grids",
     platform="POSIX",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks", "benchmarks.*")),
     include_package_data=True,
     install_requires=get_requirements(filename=requirements_file),
-    extras_require={"quality": get_requirements(filename=requirements_file_quality)},
+    extras_require={
+        "quality": get_requirements(filename=requirements_file_quality),
+        "async": get_requirements(filename=requirements_file_async),
+        "analytics": get_requirements(filename=requirements_file_analytics),
+    },
     classifiers=[
         "Development Status :: 1 - Planning",
         "Environment :: Web Environment",
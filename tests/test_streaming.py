@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from qawiremock.streaming import iter_json_array
+
+DOCUMENT = {
+    "requests": [
+        {"id": "a", "value": -12500.5, "exponent": 1.25e-7, "flag": True},
+        -12500.25,
+        0,
+        "text é",
+        None,
+        [1, 22, 333],
+    ],
+    "meta": {"total": 6},
+}
+
+
+def split(content: bytes, *positions: int) -> list[bytes]:
+    bounds = [0, *positions, len(content)]
+    return [content[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": ")])
+def test_split_at_every_byte(separators: tuple[str, str]) -> None:
+    content = json.dumps(DOCUMENT, separators=separators).encode()
+    for position in range(len(content) + 1):
+        chunks = split(content, position)
+        assert list(iter_json_array(chunks, "requests")) == DOCUMENT["requests"]
+
+
+def test_single_byte_chunks() -> None:
+    content = json.dumps(DOCUMENT).encode()
+    chunks = [content[i : i + 1] for i in range(len(content))]
+    assert list(iter_json_array(chunks, "requests")) == DOCUMENT["requests"]
+
+
+def test_number_split_after_decimal_point() -> None:
+    assert list(iter_json_array([b'{"requests": [-12500.', b"5]}"], "requests")) == [
+        -12500.5
+    ]
+
+
+def test_missing_key() -> None:
+    assert list(iter_json_array([b'{"meta": 1}'], "requests")) == []